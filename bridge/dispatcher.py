@@ -2,10 +2,11 @@
 Unified Command Dispatcher for Cadwork MCP Bridge
 Combines controller management and command dispatching with type safety
 """
+from itertools import islice
 from typing import Dict, Any, Callable, Optional
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class DispatchResult:
     """Type-safe result container for dispatch operations"""
     success: bool
@@ -71,6 +72,7 @@ class CommandDispatcher:
         if elem:
             self._function_map.update({
                 'create_beam': lambda args: self._wrap_call(elem.create_beam, args),
+                'create_beams': lambda args: self._wrap_call(elem.create_beams, args),
                 'create_panel': lambda args: self._wrap_call(elem.create_panel, args),
                 'get_active_element_ids': lambda args: self._wrap_call(elem.get_active_element_ids, args),
                 'get_all_element_ids': lambda args: self._wrap_call(elem.get_all_element_ids, args),
@@ -131,6 +133,7 @@ class CommandDispatcher:
                 'get_element_height': lambda args: self._wrap_call(geom.get_element_height, args),
                 'get_element_length': lambda args: self._wrap_call(geom.get_element_length, args),
                 'get_element_volume': lambda args: self._wrap_call(geom.get_element_volume, args),
+                'get_element_volumes': lambda args: self._wrap_call(geom.get_element_volumes, args),
                 'get_element_weight': lambda args: self._wrap_call(geom.get_element_weight, args),
                 'get_element_xl': lambda args: self._wrap_call(geom.get_element_xl, args),
                 'get_element_yl': lambda args: self._wrap_call(geom.get_element_yl, args),
@@ -155,6 +158,7 @@ class CommandDispatcher:
                 'calculate_total_volume': lambda args: self._wrap_call(geom.calculate_total_volume, args),
                 'calculate_total_weight': lambda args: self._wrap_call(geom.calculate_total_weight, args),
                 'get_bounding_box': lambda args: self._wrap_call(geom.get_bounding_box, args),
+                'get_bounding_boxes': lambda args: self._wrap_call(geom.get_bounding_boxes, args),
                 'get_element_outline': lambda args: self._wrap_call(geom.get_element_outline, args),
                 'get_section_outline': lambda args: self._wrap_call(geom.get_section_outline, args),
                 'intersect_elements': lambda args: self._wrap_call(geom.intersect_elements, args),
@@ -178,6 +182,7 @@ class CommandDispatcher:
                 'set_group': lambda args: self._wrap_call(attr.set_group, args),
                 'set_comment': lambda args: self._wrap_call(attr.set_comment, args),
                 'set_subgroup': lambda args: self._wrap_call(attr.set_subgroup, args),
+                'set_attributes': lambda args: self._wrap_call(attr.set_attributes, args),
                 'set_user_attribute': lambda args: self._wrap_call(attr.set_user_attribute, args),
                 'get_element_attribute_display_name': lambda args: self._wrap_call(attr.get_element_attribute_display_name, args),
                 'clear_user_attribute': lambda args: self._wrap_call(attr.clear_user_attribute, args),
@@ -195,6 +200,8 @@ class CommandDispatcher:
                 'set_color': lambda args: self._wrap_call(vis.set_color, args),
                 'set_visibility': lambda args: self._wrap_call(vis.set_visibility, args),
                 'set_transparency': lambda args: self._wrap_call(vis.set_transparency, args),
+                'set_colors': lambda args: self._wrap_call(vis.set_colors, args),
+                'set_transparencies': lambda args: self._wrap_call(vis.set_transparencies, args),
                 'get_color': lambda args: self._wrap_call(vis.get_color, args),
                 'get_transparency': lambda args: self._wrap_call(vis.get_transparency, args),
                 'show_all_elements': lambda args: self._wrap_call(vis.show_all_elements, args),
@@ -295,11 +302,14 @@ class CommandDispatcher:
         Returns:
             Dict with status, data, and optional error message
         """
+        if operation == 'batch':
+            return self._dispatch_batch(args)
+        
         if operation not in self._function_map:
             return {
                 "status": "error",
                 "message": f"Unknown operation: {operation}",
-                "available_operations": list(self._function_map.keys())[:20]  # Show first 20 for debugging
+                "available_operations": list(islice(self._function_map, 20))  # Show first 20 for debugging
             }
         
         result = self._function_map[operation](args)
@@ -315,6 +325,25 @@ class CommandDispatcher:
                 "message": f"Operation {operation} failed: {result.error}"
             }
 
+    def _dispatch_batch(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a list of commands from one request, results keep the request order"""
+        commands = args.get("commands")
+        if not isinstance(commands, list):
+            return {"status": "error", "message": "batch requires a list of commands"}
+        
+        results = []
+        for command in commands:
+            operation = command.get("operation") if isinstance(command, dict) else None
+            if not operation or operation == 'batch':
+                results.append({"status": "error", "message": f"Invalid batch command: {command}"})
+                continue
+            results.append(self.dispatch(operation, command.get("args") or {}))
+        
+        return {
+            "status": "success",
+            "data": results
+        }
+
 # Global dispatcher instance
 _dispatcher = CommandDispatcher()
 
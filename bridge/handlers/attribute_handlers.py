@@ -12,16 +12,16 @@ def handle_get_standard_attributes(args: Dict[str, Any]) -> Dict[str, Any]:
         
         results = {}
         
-        # Standard-Attribute definieren
-        standard_attrs = ["name", "group", "subgroup", "comment"]
+        # Standard-Attribute mit Getter-Namen einmal vorab definieren
+        standard_attrs = [(attr_key, f'get_{attr_key}') for attr_key in ("name", "group", "subgroup", "comment")]
         
         for eid in element_ids:
             elem_attrs = {}
             
             # Standard-Attribute abrufen
-            for attr_key in standard_attrs:
+            for attr_key, getter_name in standard_attrs:
                 try:
-                    value = call_cadwork_function(f'get_{attr_key}', eid)
+                    value = call_cadwork_function(getter_name, eid)
                     elem_attrs[attr_key] = value
                 except Exception:
                     elem_attrs[attr_key] = None
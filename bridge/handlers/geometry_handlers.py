@@ -1,7 +1,7 @@
 """
 Geometry operation handlers
 """
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from ..helpers import validate_element_id, validate_element_ids
 
 def handle_get_element_width(args: Dict[str, Any]) -> Dict[str, Any]:
@@ -855,9 +855,11 @@ def handle_get_bounding_box(aParams: dict) -> dict:
                 if hasattr(gc, 'get_element_vertices'):
                     lVertices = gc.get_element_vertices(lElementId)
                     if lVertices:
-                        lXCoords = [v[0] for v in lVertices]
-                        lYCoords = [v[1] for v in lVertices]
-                        lZCoords = [v[2] for v in lVertices]
+                        # Eckpunkte sind cadwork.point_3d - Koordinaten über .x/.y/.z lesen,
+                        # min/max laufen anschließend in C
+                        lXCoords = [lVertex.x for lVertex in lVertices]
+                        lYCoords = [lVertex.y for lVertex in lVertices]
+                        lZCoords = [lVertex.z for lVertex in lVertices]
                         lBoundingBox = [
                             min(lXCoords), min(lYCoords), min(lZCoords),
                             max(lXCoords), max(lYCoords), max(lZCoords)
@@ -985,6 +987,16 @@ def handle_validate_joints(args: Dict[str, Any]) -> Dict[str, Any]:
         # Get wood properties (default to C24 if not found)
         properties = wood_properties.get(wood_grade, wood_properties["C24"])
         
+        # Query each cross-section once instead of once per element pair
+        cross_sections: Dict[int, Optional[Tuple[float, float]]] = {}
+        section_errors: Dict[int, str] = {}
+        for element_id in element_ids:
+            try:
+                cross_sections[element_id] = (gc.get_width(element_id), gc.get_height(element_id))
+            except Exception as e:
+                cross_sections[element_id] = None
+                section_errors[element_id] = str(e)
+        
         # Analyze joints between element pairs
         joint_analyses = []
         for i in range(len(element_ids)):
@@ -993,11 +1005,20 @@ def handle_validate_joints(args: Dict[str, Any]) -> Dict[str, Any]:
                 element_2 = element_ids[j]
                 
                 # Get element geometries
+                section_1 = cross_sections[element_1]
+                section_2 = cross_sections[element_2]
+                if section_1 is None or section_2 is None:
+                    failed_id = element_1 if section_1 is None else element_2
+                    joint_analyses.append({
+                        "element_pair": [element_1, element_2],
+                        "error": f"Could not analyze joint: {section_errors[failed_id]}",
+                        "is_valid": False
+                    })
+                    continue
+                
                 try:
-                    width_1 = gc.get_width(element_1)
-                    height_1 = gc.get_height(element_1)
-                    width_2 = gc.get_width(element_2)
-                    height_2 = gc.get_height(element_2)
+                    width_1, height_1 = section_1
+                    width_2, height_2 = section_2
                     
                     # Calculate joint area (simplified)
                     joint_area = min(width_1 * height_1, width_2 * height_2)
@@ -132,8 +132,12 @@ def handle_generate_material_list(args: Dict[str, Any]) -> Dict[str, Any]:
         if optimization_mode not in valid_optimization_modes:
             raise ValueError(f"Invalid optimization_mode. Must be one of: {valid_optimization_modes}")
         
-        # Collect material data from elements
+        # Collect material data from elements, keeping running totals so the
+        # summary does not need another pass over the material list
         material_data: Dict[str, Dict[str, Any]] = {}
+        total_length = 0.0
+        total_volume = 0.0
+        total_count = 0
         
         for element_id in element_ids:
             try:
@@ -176,6 +180,10 @@ def handle_generate_material_list(args: Dict[str, Any]) -> Dict[str, Any]:
                 material_data[material_key]["total_volume"] += float(volume)
                 material_data[material_key]["element_ids"].append(element_id)
                 
+                total_length += float(length)
+                total_volume += float(volume)
+                total_count += 1
+                
             except Exception as e:
                 # Skip problematic elements but continue processing
                 continue
@@ -200,11 +208,6 @@ def handle_generate_material_list(args: Dict[str, Any]) -> Dict[str, Any]:
         else:
             material_list.sort(key=lambda x: str(x["material_name"]))
         
-        # Calculate totals
-        total_length = sum(float(item["total_length"]) for item in material_list)
-        total_volume = sum(float(item["total_volume"]) for item in material_list)
-        total_count = sum(int(item["count"]) for item in material_list)
-        
         if include_waste:
             total_length_with_waste = total_length * (1 + waste_factor)
             total_volume_with_waste = total_volume * (1 + waste_factor)
@@ -128,8 +128,11 @@ def handle_optimize_cutting_list(args: Dict[str, Any]) -> Dict[str, Any]:
                     stock_pieces.append(new_stock_piece)
             
             # Calculate waste for this group
-            group_waste = sum(piece["remaining_length"] for piece in stock_pieces)
-            group_stock_used = sum(piece["stock_length"] for piece in stock_pieces)
+            group_waste = 0.0
+            group_stock_used = 0.0
+            for piece in stock_pieces:
+                group_waste += piece["remaining_length"]
+                group_stock_used += piece["stock_length"]
             
             total_waste_length += group_waste
             total_stock_used += group_stock_used
@@ -12,6 +12,25 @@ if current_dir not in sys.path:
 
 from bridge.dispatcher import dispatch_command
 
+# orjson is optional - Cadwork's embedded Python usually ships without it.
+# It only speeds up decoding, encoding stays on the stdlib so NaN/Infinity
+# survive, and requests orjson rejects fall back to json.loads.
+try:
+    import orjson
+
+    def _loads(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+
+def _dumps(obj):
+    return json.dumps(obj).encode('utf-8')
+
 HOST, PORT = "127.0.0.1", 53002
 
 def socket_server():
@@ -23,7 +42,7 @@ def socket_server():
         srv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         srv.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         srv.bind(server_address)
-        srv.listen(1)
+        srv.listen(8)
         print(f"✓ Cadwork MCP Bridge listening on {HOST}:{PORT}")
     except Exception as e:
         print(f"!!! Server setup failed: {e}")
@@ -50,7 +69,7 @@ def socket_server():
                 temp_data = b''.join(raw_chunks).strip()
                 if temp_data.startswith(b'{') and temp_data.endswith(b'}'):
                     try:
-                        json.loads(temp_data.decode('utf-8'))
+                        _loads(temp_data)
                         break
                     except (json.JSONDecodeError, UnicodeDecodeError):
                         pass
@@ -61,8 +80,7 @@ def socket_server():
             # Process request
             raw = b''.join(raw_chunks)
             try:
-                decoded_data = raw.decode('utf-8')
-                parsed_msg = json.loads(decoded_data)
+                parsed_msg = _loads(raw)
                 
                 # Dispatch to handler
                 response = dispatch_command(
@@ -71,7 +89,7 @@ def socket_server():
                 )
                 
                 # Send response
-                response_bytes = json.dumps(response).encode('utf-8')
+                response_bytes = _dumps(response)
                 conn.sendall(response_bytes)
                 
             except Exception as e:
@@ -82,7 +100,7 @@ def socket_server():
                     "message": f"Processing error: {e}"
                 }
                 try:
-                    conn.sendall(json.dumps(error_response).encode('utf-8'))
+                    conn.sendall(_dumps(error_response))
                 except:
                     pass
                 
@@ -4,6 +4,9 @@ Attribute controller for attribute operations
 from typing import Dict, Any, List, Optional
 from .base_controller import BaseController
 
+# Standard-Attribute, die set_attributes in einem Request setzen kann
+SETTABLE_ATTRIBUTES = ("name", "material", "group", "comment", "subgroup")
+
 class AttributeController(BaseController):
     """Controller for attribute operations"""
     
@@ -18,7 +21,11 @@ class AttributeController(BaseController):
         # Validate all element IDs
         validated_ids = [self.validate_element_id(eid) for eid in element_ids]
         
-        return self.send_command("get_standard_attributes", {"element_ids": validated_ids})
+        # The bridge rejects an empty list - answer with its error without the round trip
+        if not validated_ids:
+            return {"status": "error", "message": "Invalid input: element_ids cannot be empty"}
+        
+        return await self.send_command("get_standard_attributes", {"element_ids": validated_ids})
     
     async def get_user_attributes(self, element_ids: List[int], 
                                  attribute_numbers: List[int]) -> Dict[str, Any]:
@@ -42,14 +49,20 @@ class AttributeController(BaseController):
             except (ValueError, TypeError):
                 raise ValueError(f"Invalid attribute number: {num}")
         
-        return self.send_command("get_user_attributes", {
+        # Answer the bridge's own replies for empty input without the round trip
+        if not validated_ids:
+            return {"status": "error", "message": "Invalid input: element_ids cannot be empty"}
+        if not validated_attrs:
+            return {"status": "ok", "user_attributes_by_id": {}}
+        
+        return await self.send_command("get_user_attributes", {
             "element_ids": validated_ids,
             "attribute_numbers": validated_attrs
         })
     
     async def list_defined_user_attributes(self) -> Dict[str, Any]:
         """List all defined user attributes"""
-        return self.send_command("list_defined_user_attributes")
+        return await self.send_command("list_defined_user_attributes")
     
     # --- ATTRIBUTE SETTERS ---
     
@@ -63,7 +76,7 @@ class AttributeController(BaseController):
         # Validate all element IDs
         validated_ids = [self.validate_element_id(eid) for eid in element_ids]
         
-        return self.send_command("set_name", {
+        return await self.send_command("set_name", {
             "element_ids": validated_ids,
             "name": str(name)
         })
@@ -78,7 +91,7 @@ class AttributeController(BaseController):
         # Validate all element IDs
         validated_ids = [self.validate_element_id(eid) for eid in element_ids]
         
-        return self.send_command("set_material", {
+        return await self.send_command("set_material", {
             "element_ids": validated_ids,
             "material": str(material)
         })
@@ -105,7 +118,7 @@ class AttributeController(BaseController):
                 return {"status": "error", "message": "group must be a string"}
             
             # Command senden
-            return self.send_command("set_group", {
+            return await self.send_command("set_group", {
                 "element_ids": lValidatedIds,
                 "group": aGroup
             })
@@ -135,7 +148,7 @@ class AttributeController(BaseController):
                 return {"status": "error", "message": "comment must be a string"}
             
             # Command senden
-            return self.send_command("set_comment", {
+            return await self.send_command("set_comment", {
                 "element_ids": lValidatedIds,
                 "comment": aComment
             })
@@ -165,7 +178,7 @@ class AttributeController(BaseController):
                 return {"status": "error", "message": "subgroup must be a string"}
             
             # Command senden
-            return self.send_command("set_subgroup", {
+            return await self.send_command("set_subgroup", {
                 "element_ids": lValidatedIds,
                 "subgroup": aSubgroup
             })
@@ -173,6 +186,42 @@ class AttributeController(BaseController):
         except Exception as e:
             return {"status": "error", "message": f"set_subgroup failed: {e}"}
     
+    async def set_attributes(self, aElementIds: list, aAttributes: dict) -> dict:
+        """
+        Setzt mehrere Standard-Attribute mit einem einzigen Request
+        
+        Args:
+            aElementIds: Liste der Element-IDs
+            aAttributes: Attribut-Werte, Schlüssel aus name, material, group, comment, subgroup
+        
+        Returns:
+            dict: Status der Operation
+        """
+        try:
+            # Validierung
+            if not isinstance(aElementIds, list) or not aElementIds:
+                return {"status": "error", "message": "element_ids must be a non-empty list"}
+            
+            lValidatedIds = [self.validate_element_id(lId) for lId in aElementIds]
+            
+            if not isinstance(aAttributes, dict) or not aAttributes:
+                return {"status": "error", "message": "attributes must be a non-empty dictionary"}
+            
+            for lKey, lValue in aAttributes.items():
+                if lKey not in SETTABLE_ATTRIBUTES:
+                    return {"status": "error", "message": f"Unknown attribute '{lKey}', allowed: {', '.join(SETTABLE_ATTRIBUTES)}"}
+                if not isinstance(lValue, str):
+                    return {"status": "error", "message": f"{lKey} must be a string"}
+            
+            # Command senden
+            return await self.send_command("set_attributes", {
+                "element_ids": lValidatedIds,
+                "attributes": aAttributes
+            })
+            
+        except Exception as e:
+            return {"status": "error", "message": f"set_attributes failed: {e}"}
+    
     async def set_user_attribute(self, element_ids: List[int], attribute_number: int, attribute_value: str) -> Dict[str, Any]:
         """Set user-defined attribute for elements"""
         if not isinstance(element_ids, list) or not element_ids:
@@ -198,7 +247,7 @@ class AttributeController(BaseController):
             "attribute_value": str(attribute_value)
         }
         
-        return self.send_command("set_user_attribute", args)
+        return await self.send_command("set_user_attribute", args)
     
     async def get_element_attribute_display_name(self, attribute_number: int) -> Dict[str, Any]:
         """Get display name for a user-defined attribute number"""
@@ -214,7 +263,7 @@ class AttributeController(BaseController):
             "attribute_number": attr_num
         }
         
-        return self.send_command("get_element_attribute_display_name", args)
+        return await self.send_command("get_element_attribute_display_name", args)
     
     async def clear_user_attribute(self, element_ids: List[int], attribute_number: int) -> Dict[str, Any]:
         """Clear/delete user-defined attribute for elements"""
@@ -237,7 +286,7 @@ class AttributeController(BaseController):
             "attribute_number": attr_num
         }
         
-        return self.send_command("clear_user_attribute", args)
+        return await self.send_command("clear_user_attribute", args)
     
     async def copy_attributes(self, source_element_id: int, target_element_ids: List[int], 
                             copy_user_attributes: bool = True, copy_standard_attributes: bool = True) -> Dict[str, Any]:
@@ -268,7 +317,7 @@ class AttributeController(BaseController):
             "copy_standard_attributes": copy_standard_attributes
         }
         
-        return self.send_command("copy_attributes", args)
+        return await self.send_command("copy_attributes", args)
     
     async def batch_set_user_attributes(self, element_ids: List[int], 
                                       attribute_mappings: Dict[int, str]) -> Dict[str, Any]:
@@ -304,7 +353,7 @@ class AttributeController(BaseController):
             "attribute_mappings": validated_mappings
         }
         
-        return self.send_command("batch_set_user_attributes", args)
+        return await self.send_command("batch_set_user_attributes", args)
     
     async def validate_attribute_consistency(self, element_ids: List[int], 
                                            attribute_numbers: List[int],
@@ -348,7 +397,7 @@ class AttributeController(BaseController):
             "check_uniqueness": check_uniqueness
         }
         
-        return self.send_command("validate_attribute_consistency", args)
+        return await self.send_command("validate_attribute_consistency", args)
     
     async def search_elements_by_attributes(self, search_criteria: Dict[str, Any], 
                                           search_mode: str = "AND") -> Dict[str, Any]:
@@ -404,7 +453,7 @@ class AttributeController(BaseController):
             "search_mode": search_mode.upper()
         }
         
-        return self.send_command("search_elements_by_attributes", args)
+        return await self.send_command("search_elements_by_attributes", args)
     
     async def export_attribute_report(self, element_ids: List[int], 
                                     report_format: str = "JSON",
@@ -471,4 +520,4 @@ class AttributeController(BaseController):
         if group_by is not None:
             args["group_by"] = group_by
         
-        return self.send_command("export_attribute_report", args)
+        return await self.send_command("export_attribute_report", args)
@@ -11,11 +11,11 @@ class BaseController:
     def __init__(self, controller_name: str):
         self.controller_name = controller_name
     
-    def send_command(self, operation: str, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    async def send_command(self, operation: str, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Send command to Cadwork and handle common error cases"""
         try:
             connection = get_connection()
-            response = connection.send_command(operation, args or {})
+            response = await connection.send_command_async(operation, args or {})
             
             if response.get("status") == "ok":
                 log_info(f"{self.controller_name}: {operation} completed successfully")
@@ -34,6 +34,24 @@ class BaseController:
             log_error(f"{self.controller_name}: Unexpected error - {e}")
             return {"status": "error", "message": f"Unexpected error: {e}"}
     
+    async def send_batch(self, commands: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Send several independent commands to Cadwork in a single round trip"""
+        try:
+            connection = get_connection()
+            response = await connection.send_batch_async(commands)
+            log_info(f"{self.controller_name}: batch of {len(commands)} commands completed")
+            return response
+            
+        except ConnectionError as e:
+            log_error(f"{self.controller_name}: Connection error - {e}")
+            return {"status": "error", "message": f"Connection failed: {e}"}
+        except TimeoutError as e:
+            log_error(f"{self.controller_name}: Timeout error - {e}")
+            return {"status": "error", "message": f"Operation timed out: {e}"}
+        except Exception as e:
+            log_error(f"{self.controller_name}: Unexpected error - {e}")
+            return {"status": "error", "message": f"Unexpected error: {e}"}
+    
     def validate_required_args(self, args: Dict[str, Any], required: List[str]) -> None:
         """Validate that all required arguments are present"""
         missing = [key for key in required if key not in args]
@@ -29,7 +29,7 @@ class ContainerController(BaseController):
             "container_name": container_name.strip()
         }
         
-        return self.send_command("create_auto_container_from_standard", args)
+        return await self.send_command("create_auto_container_from_standard", args)
     
     async def get_container_content_elements(self, container_id: int) -> Dict[str, Any]:
         """Retrieves all elements contained within a specific container"""
@@ -39,4 +39,4 @@ class ContainerController(BaseController):
             "container_id": validated_id
         }
         
-        return self.send_command("get_container_content_elements", args)
+        return await self.send_command("get_container_content_elements", args)
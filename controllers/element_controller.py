@@ -22,7 +22,30 @@ class ElementController(BaseController):
         if p3 is not None:
             args["p3"] = p3
         
-        return self.send_command("create_beam", args)
+        return await self.send_command("create_beam", args)
+    
+    async def create_beams(self, beams: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create several rectangular beams with a single bridge request"""
+        if not isinstance(beams, list) or not beams:
+            raise ValueError("beams must be a non-empty list")
+        
+        validated_beams: List[Dict[str, Any]] = []
+        for beam in beams:
+            if not isinstance(beam, dict):
+                raise ValueError(f"Each beam must be a dictionary, got: {beam}")
+            self.validate_required_args(beam, ["p1", "p2", "width", "height"])
+            
+            beam_args: Dict[str, Any] = {
+                "p1": self.validate_point_3d(beam["p1"], "p1"),
+                "p2": self.validate_point_3d(beam["p2"], "p2"),
+                "width": beam["width"],
+                "height": beam["height"]
+            }
+            if beam.get("p3") is not None:
+                beam_args["p3"] = self.validate_point_3d(beam["p3"], "p3")
+            validated_beams.append(beam_args)
+        
+        return await self.send_command("create_beams", {"beams": validated_beams})
     
     async def create_panel(self, p1: List[float], p2: List[float], width: float, thickness: float,
                           p3: Optional[List[float]] = None) -> Dict[str, Any]:
@@ -36,32 +59,37 @@ class ElementController(BaseController):
         if p3 is not None:
             args["p3"] = p3
         
-        return self.send_command("create_panel", args)
+        return await self.send_command("create_panel", args)
     
     async def get_active_element_ids(self) -> Dict[str, Any]:
         """Get active element IDs"""
-        return self.send_command("get_active_element_ids")
+        return await self.send_command("get_active_element_ids")
     
     async def get_all_element_ids(self) -> Dict[str, Any]:
         """Get all element IDs in the model"""
-        return self.send_command("get_all_element_ids")
+        return await self.send_command("get_all_element_ids")
     
     async def get_visible_element_ids(self) -> Dict[str, Any]:
         """Get visible element IDs"""
-        return self.send_command("get_visible_element_ids")
+        return await self.send_command("get_visible_element_ids")
     
     async def get_element_info(self, element_id: int) -> Dict[str, Any]:
         """Get element information"""
         element_id = self.validate_element_id(element_id)
-        return self.send_command("get_element_info", {"element_id": element_id})
+        return await self.send_command("get_element_info", {"element_id": element_id})
     
     async def delete_elements(self, element_ids: List[int]) -> Dict[str, Any]:
         """Delete elements from the model"""
         if not isinstance(element_ids, list):
             raise ValueError("element_ids must be a list")
         
-        validated_ids = [self.validate_element_id(eid) for eid in element_ids]
-        return self.send_command("delete_elements", {"element_ids": validated_ids})
+        # Drop duplicate IDs (keeping order) so deleted_count matches the model
+        validated_ids = list(dict.fromkeys(self.validate_element_id(eid) for eid in element_ids))
+        # The bridge rejects an empty list - answer with its error without the round trip
+        if not validated_ids:
+            return {"status": "error", "message": "Invalid input: element_ids cannot be empty"}
+        
+        return await self.send_command("delete_elements", {"element_ids": validated_ids})
     
     async def copy_elements(self, element_ids: List[int], copy_vector: List[float]) -> Dict[str, Any]:
         """Copy elements with a given vector offset"""
@@ -71,7 +99,7 @@ class ElementController(BaseController):
             raise ValueError("copy_vector must be a list of 3 numbers [x, y, z]")
         
         validated_ids = [self.validate_element_id(eid) for eid in element_ids]
-        return self.send_command("copy_elements", {
+        return await self.send_command("copy_elements", {
             "element_ids": validated_ids,
             "copy_vector": copy_vector
         })
@@ -84,7 +112,7 @@ class ElementController(BaseController):
             raise ValueError("move_vector must be a list of 3 numbers [x, y, z]")
         
         validated_ids = [self.validate_element_id(eid) for eid in element_ids]
-        return self.send_command("move_element", {
+        return await self.send_command("move_element", {
             "element_ids": validated_ids,
             "move_vector": move_vector
         })
@@ -97,7 +125,7 @@ class ElementController(BaseController):
                 raise ValueError("count must be a positive integer")
             args["count"] = count
         
-        return self.send_command("get_user_element_ids", args)
+        return await self.send_command("get_user_element_ids", args)
     
     async def duplicate_elements(self, element_ids: List[int]) -> Dict[str, Any]:
         """Duplicate elements at the same location (no offset)"""
@@ -106,7 +134,7 @@ class ElementController(BaseController):
                 return {"status": "error", "message": "element_ids must be a non-empty list"}
             
             validated_ids = [self.validate_element_id(eid) for eid in element_ids]
-            return self.send_command("duplicate_elements", {"element_ids": validated_ids})
+            return await self.send_command("duplicate_elements", {"element_ids": validated_ids})
             
         except Exception as e:
             return {"status": "error", "message": f"duplicate_elements failed: {e}"}
@@ -133,7 +161,7 @@ class ElementController(BaseController):
                 "stretch_factor": float(stretch_factor)
             }
             
-            return self.send_command("stretch_elements", args)
+            return await self.send_command("stretch_elements", args)
             
         except Exception as e:
             return {"status": "error", "message": f"stretch_elements failed: {e}"}
@@ -161,7 +189,7 @@ class ElementController(BaseController):
                     return {"status": "error", "message": "origin_point must be a list of 3 coordinates [x,y,z]"}
                 args["origin_point"] = [float(coord) for coord in origin_point]
             
-            return self.send_command("scale_elements", args)
+            return await self.send_command("scale_elements", args)
             
         except Exception as e:
             return {"status": "error", "message": f"scale_elements failed: {e}"}
@@ -194,7 +222,7 @@ class ElementController(BaseController):
                 "mirror_plane_normal": validated_normal
             }
             
-            return self.send_command("mirror_elements", args)
+            return await self.send_command("mirror_elements", args)
             
         except Exception as e:
             return {"status": "error", "message": f"mirror_elements failed: {e}"}
@@ -231,7 +259,7 @@ class ElementController(BaseController):
                 if validated_p3 is not None:
                     args["p3"] = validated_p3
             
-            return self.send_command("create_solid_wood_panel", args)
+            return await self.send_command("create_solid_wood_panel", args)
             
         except Exception as e:
             return {"status": "error", "message": f"create_solid_wood_panel failed: {e}"}
@@ -261,7 +289,7 @@ class ElementController(BaseController):
                 if validated_p3 is not None:
                     args["p3"] = validated_p3
             
-            return self.send_command("create_circular_beam_points", args)
+            return await self.send_command("create_circular_beam_points", args)
             
         except Exception as e:
             return {"status": "error", "message": f"create_circular_beam_points failed: {e}"}
@@ -289,7 +317,7 @@ class ElementController(BaseController):
                 if validated_p3 is not None:
                     args["p3"] = validated_p3
             
-            return self.send_command("create_square_beam_points", args)
+            return await self.send_command("create_square_beam_points", args)
             
         except Exception as e:
             return {"status": "error", "message": f"create_square_beam_points failed: {e}"}
@@ -317,7 +345,7 @@ class ElementController(BaseController):
                 if validated_p3 is not None:
                     args["p3"] = validated_p3
             
-            return self.send_command("create_standard_beam_points", args)
+            return await self.send_command("create_standard_beam_points", args)
             
         except Exception as e:
             return {"status": "error", "message": f"create_standard_beam_points failed: {e}"}
@@ -345,7 +373,7 @@ class ElementController(BaseController):
                 if validated_p3 is not None:
                     args["p3"] = validated_p3
             
-            return self.send_command("create_standard_panel_points", args)
+            return await self.send_command("create_standard_panel_points", args)
             
         except Exception as e:
             return {"status": "error", "message": f"create_standard_panel_points failed: {e}"}
@@ -367,7 +395,7 @@ class ElementController(BaseController):
                 "p2": validated_p2
             }
             
-            return self.send_command("create_drilling_points", args)
+            return await self.send_command("create_drilling_points", args)
             
         except Exception as e:
             return {"status": "error", "message": f"create_drilling_points failed: {e}"}
@@ -402,7 +430,7 @@ class ElementController(BaseController):
                 "zl": validated_zl
             }
             
-            return self.send_command("create_polygon_beam", args)
+            return await self.send_command("create_polygon_beam", args)
             
         except Exception as e:
             return {"status": "error", "message": f"create_polygon_beam failed: {e}"}
@@ -416,7 +444,7 @@ class ElementController(BaseController):
             if not isinstance(element_type, str) or not element_type.strip():
                 return {"status": "error", "message": "element_type must be a non-empty string"}
             
-            return self.send_command("get_elements_by_type", {"element_type": element_type.strip()})
+            return await self.send_command("get_elements_by_type", {"element_type": element_type.strip()})
             
         except Exception as e:
             return {"status": "error", "message": f"get_elements_by_type failed: {e}"}
@@ -427,7 +455,7 @@ class ElementController(BaseController):
             if not isinstance(material_name, str) or not material_name.strip():
                 return {"status": "error", "message": "material_name must be a non-empty string"}
             
-            return self.send_command("filter_elements_by_material", {"material_name": material_name.strip()})
+            return await self.send_command("filter_elements_by_material", {"material_name": material_name.strip()})
             
         except Exception as e:
             return {"status": "error", "message": f"filter_elements_by_material failed: {e}"}
@@ -438,7 +466,7 @@ class ElementController(BaseController):
             if not isinstance(group_name, str) or not group_name.strip():
                 return {"status": "error", "message": "group_name must be a non-empty string"}
             
-            return self.send_command("get_elements_in_group", {"group_name": group_name.strip()})
+            return await self.send_command("get_elements_in_group", {"group_name": group_name.strip()})
             
         except Exception as e:
             return {"status": "error", "message": f"get_elements_in_group failed: {e}"}
@@ -449,7 +477,7 @@ class ElementController(BaseController):
             if not isinstance(color_id, int) or color_id < 1 or color_id > 255:
                 return {"status": "error", "message": "color_id must be an integer between 1 and 255"}
             
-            return self.send_command("get_elements_by_color", {"color_id": color_id})
+            return await self.send_command("get_elements_by_color", {"color_id": color_id})
             
         except Exception as e:
             return {"status": "error", "message": f"get_elements_by_color failed: {e}"}
@@ -460,7 +488,7 @@ class ElementController(BaseController):
             if not isinstance(layer_name, str) or not layer_name.strip():
                 return {"status": "error", "message": "layer_name must be a non-empty string"}
             
-            return self.send_command("get_elements_by_layer", {"layer_name": layer_name.strip()})
+            return await self.send_command("get_elements_by_layer", {"layer_name": layer_name.strip()})
             
         except Exception as e:
             return {"status": "error", "message": f"get_elements_by_layer failed: {e}"}
@@ -488,7 +516,7 @@ class ElementController(BaseController):
             max_val = float(max_value)
             dim_type = dimension_type.lower()
             
-            return self.send_command("get_elements_by_dimension_range", {
+            return await self.send_command("get_elements_by_dimension_range", {
                 "dimension_type": dim_type,
                 "min_value": min_val,
                 "max_value": max_val
@@ -502,7 +530,7 @@ class ElementController(BaseController):
     async def get_element_count_by_type(self) -> Dict[str, Any]:
         """Get count statistics of all elements by type"""
         try:
-            return self.send_command("get_element_count_by_type")
+            return await self.send_command("get_element_count_by_type")
             
         except Exception as e:
             return {"status": "error", "message": f"get_element_count_by_type failed: {e}"}
@@ -510,7 +538,7 @@ class ElementController(BaseController):
     async def get_material_statistics(self) -> Dict[str, Any]:
         """Get material usage statistics for the entire model"""
         try:
-            return self.send_command("get_material_statistics")
+            return await self.send_command("get_material_statistics")
             
         except Exception as e:
             return {"status": "error", "message": f"get_material_statistics failed: {e}"}
@@ -518,7 +546,7 @@ class ElementController(BaseController):
     async def get_group_statistics(self) -> Dict[str, Any]:
         """Get group usage statistics for the entire model"""
         try:
-            return self.send_command("get_group_statistics")
+            return await self.send_command("get_group_statistics")
             
         except Exception as e:
             return {"status": "error", "message": f"get_group_statistics failed: {e}"}
@@ -532,7 +560,7 @@ class ElementController(BaseController):
                 return {"status": "error", "message": "element_ids must be a list with at least 2 element IDs"}
             
             validated_ids = [self.validate_element_id(eid) for eid in element_ids]
-            return self.send_command("join_elements", {"element_ids": validated_ids})
+            return await self.send_command("join_elements", {"element_ids": validated_ids})
             
         except Exception as e:
             return {"status": "error", "message": f"join_elements failed: {e}"}
@@ -544,7 +572,7 @@ class ElementController(BaseController):
                 return {"status": "error", "message": "element_ids must be a non-empty list"}
             
             validated_ids = [self.validate_element_id(eid) for eid in element_ids]
-            return self.send_command("unjoin_elements", {"element_ids": validated_ids})
+            return await self.send_command("unjoin_elements", {"element_ids": validated_ids})
             
         except Exception as e:
             return {"status": "error", "message": f"unjoin_elements failed: {e}"}
@@ -563,7 +591,7 @@ class ElementController(BaseController):
             if cut_params is not None:
                 args["cut_params"] = cut_params
             
-            return self.send_command("cut_corner_lap", args)
+            return await self.send_command("cut_corner_lap", args)
             
         except Exception as e:
             return {"status": "error", "message": f"cut_corner_lap failed: {e}"}
@@ -580,7 +608,7 @@ class ElementController(BaseController):
             if cut_params is not None:
                 args["cut_params"] = cut_params
             
-            return self.send_command("cut_cross_lap", args)
+            return await self.send_command("cut_cross_lap", args)
             
         except Exception as e:
             return {"status": "error", "message": f"cut_cross_lap failed: {e}"}
@@ -597,7 +625,7 @@ class ElementController(BaseController):
             if cut_params is not None:
                 args["cut_params"] = cut_params
             
-            return self.send_command("cut_half_lap", args)
+            return await self.send_command("cut_half_lap", args)
             
         except Exception as e:
             return {"status": "error", "message": f"cut_half_lap failed: {e}"}
@@ -614,7 +642,7 @@ class ElementController(BaseController):
             if cut_params is not None:
                 args["cut_params"] = cut_params
             
-            return self.send_command("cut_double_tenon", args)
+            return await self.send_command("cut_double_tenon", args)
             
         except Exception as e:
             return {"status": "error", "message": f"cut_double_tenon failed: {e}"}
@@ -631,7 +659,7 @@ class ElementController(BaseController):
             if cut_params is not None:
                 args["cut_params"] = cut_params
             
-            return self.send_command("cut_scarf_joint", args)
+            return await self.send_command("cut_scarf_joint", args)
             
         except Exception as e:
             return {"status": "error", "message": f"cut_scarf_joint failed: {e}"}
@@ -648,7 +676,7 @@ class ElementController(BaseController):
             if cut_params is not None:
                 args["cut_params"] = cut_params
             
-            return self.send_command("cut_shoulder", args)
+            return await self.send_command("cut_shoulder", args)
             
         except Exception as e:
             return {"status": "error", "message": f"cut_shoulder failed: {e}"}
@@ -674,7 +702,7 @@ class ElementController(BaseController):
                 if validated_p3 is not None:
                     args["p3"] = validated_p3
             
-            return self.send_command("create_auxiliary_beam_points", args)
+            return await self.send_command("create_auxiliary_beam_points", args)
             
         except Exception as e:
             return {"status": "error", "message": f"create_auxiliary_beam_points failed: {e}"}
@@ -686,7 +714,7 @@ class ElementController(BaseController):
                 return {"status": "error", "message": "element_ids must be a non-empty list"}
             
             validated_ids = [self.validate_element_id(eid) for eid in element_ids]
-            return self.send_command("convert_beam_to_panel", {"element_ids": validated_ids})
+            return await self.send_command("convert_beam_to_panel", {"element_ids": validated_ids})
             
         except Exception as e:
             return {"status": "error", "message": f"convert_beam_to_panel failed: {e}"}
@@ -698,7 +726,7 @@ class ElementController(BaseController):
                 return {"status": "error", "message": "element_ids must be a non-empty list"}
             
             validated_ids = [self.validate_element_id(eid) for eid in element_ids]
-            return self.send_command("convert_panel_to_beam", {"element_ids": validated_ids})
+            return await self.send_command("convert_panel_to_beam", {"element_ids": validated_ids})
             
         except Exception as e:
             return {"status": "error", "message": f"convert_panel_to_beam failed: {e}"}
@@ -710,7 +738,7 @@ class ElementController(BaseController):
                 return {"status": "error", "message": "element_ids must be a non-empty list"}
             
             validated_ids = [self.validate_element_id(eid) for eid in element_ids]
-            return self.send_command("convert_auxiliary_to_beam", {"element_ids": validated_ids})
+            return await self.send_command("convert_auxiliary_to_beam", {"element_ids": validated_ids})
             
         except Exception as e:
             return {"status": "error", "message": f"convert_auxiliary_to_beam failed: {e}"}
@@ -733,7 +761,7 @@ class ElementController(BaseController):
                 "container_name": container_name.strip()
             }
             
-            return self.send_command("create_auto_container_from_standard", args)
+            return await self.send_command("create_auto_container_from_standard", args)
             
         except Exception as e:
             return {"status": "error", "message": f"create_auto_container_from_standard failed: {e}"}
@@ -742,7 +770,7 @@ class ElementController(BaseController):
         """Get all elements contained within a specific container"""
         try:
             validated_id = self.validate_element_id(container_id)
-            return self.send_command("get_container_content_elements", {"container_id": validated_id})
+            return await self.send_command("get_container_content_elements", {"container_id": validated_id})
             
         except Exception as e:
             return {"status": "error", "message": f"get_container_content_elements failed: {e}"}
@@ -781,7 +809,7 @@ class ElementController(BaseController):
                 "surface_type": surface_type
             }
             
-            return self.send_command("create_surface", args)
+            return await self.send_command("create_surface", args)
             
         except Exception as e:
             return {"status": "error", "message": f"create_surface failed: {e}"}
@@ -840,7 +868,7 @@ class ElementController(BaseController):
                 "chamfer_type": chamfer_type
             }
             
-            return self.send_command("chamfer_edge", args)
+            return await self.send_command("chamfer_edge", args)
             
         except Exception as e:
             return {"status": "error", "message": f"chamfer_edge failed: {e}"}
@@ -899,7 +927,7 @@ class ElementController(BaseController):
                 "round_type": round_type
             }
             
-            return self.send_command("round_edge", args)
+            return await self.send_command("round_edge", args)
             
         except Exception as e:
             return {"status": "error", "message": f"round_edge failed: {e}"}
@@ -943,7 +971,7 @@ class ElementController(BaseController):
                 "keep_both_parts": keep_both_parts
             }
             
-            return self.send_command("split_element", args)
+            return await self.send_command("split_element", args)
             
         except Exception as e:
             return {"status": "error", "message": f"split_element failed: {e}"}
@@ -1012,7 +1040,7 @@ class ElementController(BaseController):
                 "material": material.strip()
             }
             
-            return self.send_command("create_beam_from_points", args)
+            return await self.send_command("create_beam_from_points", args)
             
         except Exception as e:
             return {"status": "error", "message": f"create_beam_from_points failed: {e}"}
@@ -1055,7 +1083,7 @@ class ElementController(BaseController):
                 "line_type": line_type
             }
             
-            return self.send_command("create_auxiliary_line", args)
+            return await self.send_command("create_auxiliary_line", args)
             
         except Exception as e:
             return {"status": "error", "message": f"create_auxiliary_line failed: {e}"}
@@ -1085,7 +1113,7 @@ class ElementController(BaseController):
                 "include_partially": include_partially
             }
             
-            return self.send_command("get_elements_in_region", args)
+            return await self.send_command("get_elements_in_region", args)
             
         except Exception as e:
             return {"status": "error", "message": f"get_elements_in_region failed: {e}"}
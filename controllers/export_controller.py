@@ -34,10 +34,7 @@ class ExportController(BaseController):
                 if not isinstance(element_ids, list) or len(element_ids) == 0:
                     return {"status": "error", "message": "element_ids must be a non-empty list when provided"}
                 
-                validated_ids = []
-                for element_id in element_ids:
-                    validated_id = self.validate_element_id(element_id)
-                    validated_ids.append(validated_id)
+                validated_ids = [self.validate_element_id(element_id) for element_id in element_ids]
                 
                 export_params["element_ids"] = validated_ids
             else:
@@ -63,7 +60,7 @@ class ExportController(BaseController):
             if not isinstance(include_geometry, bool):
                 export_params["include_geometry"] = True
             
-            return self.send_command("export_to_btl", export_params)
+            return await self.send_command("export_to_btl", export_params)
             
         except Exception as e:
             return {"status": "error", "message": f"export_to_btl failed: {e}"}
@@ -71,7 +68,7 @@ class ExportController(BaseController):
     async def get_export_formats(self) -> Dict[str, Any]:
         """Get list of available export formats"""
         try:
-            return self.send_command("get_export_formats", {})
+            return await self.send_command("get_export_formats", {})
             
         except Exception as e:
             return {"status": "error", "message": f"get_export_formats failed: {e}"}
@@ -87,10 +84,7 @@ class ExportController(BaseController):
             if not isinstance(element_ids, list) or len(element_ids) == 0:
                 return {"status": "error", "message": "element_ids must be a non-empty list"}
             
-            validated_ids = []
-            for element_id in element_ids:
-                validated_id = self.validate_element_id(element_id)
-                validated_ids.append(validated_id)
+            validated_ids = [self.validate_element_id(element_id) for element_id in element_ids]
             
             # Validate export format
             valid_formats = ["csv", "xlsx", "json", "xml"]
@@ -117,7 +111,7 @@ class ExportController(BaseController):
                 
                 export_params["file_path"] = file_path
             
-            return self.send_command("export_element_list", export_params)
+            return await self.send_command("export_element_list", export_params)
             
         except Exception as e:
             return {"status": "error", "message": f"export_element_list failed: {e}"}
@@ -145,17 +139,14 @@ class ExportController(BaseController):
                 if not isinstance(element_ids, list) or len(element_ids) == 0:
                     return {"status": "error", "message": "element_ids must be a non-empty list when provided"}
                 
-                validated_ids = []
-                for element_id in element_ids:
-                    validated_id = self.validate_element_id(element_id)
-                    validated_ids.append(validated_id)
+                validated_ids = [self.validate_element_id(element_id) for element_id in element_ids]
                 
                 cutting_params["element_ids"] = validated_ids
             else:
                 # Use all visible elements if none specified
                 cutting_params["use_all_visible"] = True
             
-            return self.send_command("export_cutting_list", cutting_params)
+            return await self.send_command("export_cutting_list", cutting_params)
             
         except Exception as e:
             return {"status": "error", "message": f"export_cutting_list failed: {e}"}
@@ -193,10 +184,7 @@ class ExportController(BaseController):
                 if not isinstance(element_ids, list) or len(element_ids) == 0:
                     return {"status": "error", "message": "element_ids must be a non-empty list when provided"}
                 
-                validated_ids = []
-                for element_id in element_ids:
-                    validated_id = self.validate_element_id(element_id)
-                    validated_ids.append(validated_id)
+                validated_ids = [self.validate_element_id(element_id) for element_id in element_ids]
                 
                 export_params["element_ids"] = validated_ids
             else:
@@ -215,7 +203,7 @@ class ExportController(BaseController):
                 
                 export_params["file_path"] = file_path
             
-            return self.send_command("export_to_ifc", export_params)
+            return await self.send_command("export_to_ifc", export_params)
             
         except Exception as e:
             return {"status": "error", "message": f"export_to_ifc failed: {e}"}
@@ -255,10 +243,7 @@ class ExportController(BaseController):
                 if not isinstance(element_ids, list) or len(element_ids) == 0:
                     return {"status": "error", "message": "element_ids must be a non-empty list when provided"}
                 
-                validated_ids = []
-                for element_id in element_ids:
-                    validated_id = self.validate_element_id(element_id)
-                    validated_ids.append(validated_id)
+                validated_ids = [self.validate_element_id(element_id) for element_id in element_ids]
                 
                 export_params["element_ids"] = validated_ids
             else:
@@ -276,7 +261,7 @@ class ExportController(BaseController):
                 
                 export_params["file_path"] = file_path
             
-            return self.send_command("export_to_dxf", export_params)
+            return await self.send_command("export_to_dxf", export_params)
             
         except Exception as e:
             return {"status": "error", "message": f"export_to_dxf failed: {e}"}
@@ -318,16 +303,13 @@ class ExportController(BaseController):
                 if not isinstance(element_ids, list) or len(element_ids) == 0:
                     return {"status": "error", "message": "element_ids must be a non-empty list when provided"}
                 
-                validated_ids = []
-                for element_id in element_ids:
-                    validated_id = self.validate_element_id(element_id)
-                    validated_ids.append(validated_id)
+                validated_ids = [self.validate_element_id(element_id) for element_id in element_ids]
                 
                 export_params["element_ids"] = validated_ids
             else:
                 export_params["export_all_visible"] = True
             
-            return self.send_command("export_workshop_drawings", export_params)
+            return await self.send_command("export_workshop_drawings", export_params)
             
         except Exception as e:
             return {"status": "error", "message": f"export_workshop_drawings failed: {e}"}
@@ -365,10 +347,7 @@ class ExportController(BaseController):
                 if not isinstance(element_ids, list) or len(element_ids) == 0:
                     return {"status": "error", "message": "element_ids must be a non-empty list when provided"}
                 
-                validated_ids = []
-                for element_id in element_ids:
-                    validated_id = self.validate_element_id(element_id)
-                    validated_ids.append(validated_id)
+                validated_ids = [self.validate_element_id(element_id) for element_id in element_ids]
                 
                 export_params["element_ids"] = validated_ids
             else:
@@ -386,7 +365,7 @@ class ExportController(BaseController):
                 
                 export_params["file_path"] = file_path
             
-            return self.send_command("export_to_step", export_params)
+            return await self.send_command("export_to_step", export_params)
             
         except Exception as e:
             return {"status": "error", "message": f"export_to_step failed: {e}"}
@@ -422,10 +401,7 @@ class ExportController(BaseController):
                 if not isinstance(element_ids, list) or len(element_ids) == 0:
                     return {"status": "error", "message": "element_ids must be a non-empty list when provided"}
                 
-                validated_ids = []
-                for element_id in element_ids:
-                    validated_id = self.validate_element_id(element_id)
-                    validated_ids.append(validated_id)
+                validated_ids = [self.validate_element_id(element_id) for element_id in element_ids]
                 
                 export_params["element_ids"] = validated_ids
             else:
@@ -443,7 +419,7 @@ class ExportController(BaseController):
                 
                 export_params["file_path"] = file_path
             
-            return self.send_command("export_to_3dm", export_params)
+            return await self.send_command("export_to_3dm", export_params)
             
         except Exception as e:
             return {"status": "error", "message": f"export_to_3dm failed: {e}"}
@@ -474,10 +450,7 @@ class ExportController(BaseController):
                 if not isinstance(element_ids, list) or len(element_ids) == 0:
                     return {"status": "error", "message": "element_ids must be a non-empty list when provided"}
                 
-                validated_ids = []
-                for element_id in element_ids:
-                    validated_id = self.validate_element_id(element_id)
-                    validated_ids.append(validated_id)
+                validated_ids = [self.validate_element_id(element_id) for element_id in element_ids]
                 
                 export_params["element_ids"] = validated_ids
             else:
@@ -495,7 +468,7 @@ class ExportController(BaseController):
                 
                 export_params["file_path"] = file_path
             
-            return self.send_command("export_to_obj", export_params)
+            return await self.send_command("export_to_obj", export_params)
             
         except Exception as e:
             return {"status": "error", "message": f"export_to_obj failed: {e}"}
@@ -530,10 +503,7 @@ class ExportController(BaseController):
                 if not isinstance(element_ids, list) or len(element_ids) == 0:
                     return {"status": "error", "message": "element_ids must be a non-empty list when provided"}
                 
-                validated_ids = []
-                for element_id in element_ids:
-                    validated_id = self.validate_element_id(element_id)
-                    validated_ids.append(validated_id)
+                validated_ids = [self.validate_element_id(element_id) for element_id in element_ids]
                 
                 export_params["element_ids"] = validated_ids
             else:
@@ -551,7 +521,7 @@ class ExportController(BaseController):
                 
                 export_params["file_path"] = file_path
             
-            return self.send_command("export_to_ply", export_params)
+            return await self.send_command("export_to_ply", export_params)
             
         except Exception as e:
             return {"status": "error", "message": f"export_to_ply failed: {e}"}
@@ -592,10 +562,7 @@ class ExportController(BaseController):
                 if not isinstance(element_ids, list) or len(element_ids) == 0:
                     return {"status": "error", "message": "element_ids must be a non-empty list when provided"}
                 
-                validated_ids = []
-                for element_id in element_ids:
-                    validated_id = self.validate_element_id(element_id)
-                    validated_ids.append(validated_id)
+                validated_ids = [self.validate_element_id(element_id) for element_id in element_ids]
                 
                 export_params["element_ids"] = validated_ids
             else:
@@ -613,7 +580,7 @@ class ExportController(BaseController):
                 
                 export_params["file_path"] = file_path
             
-            return self.send_command("export_to_stl", export_params)
+            return await self.send_command("export_to_stl", export_params)
             
         except Exception as e:
             return {"status": "error", "message": f"export_to_stl failed: {e}"}
@@ -656,10 +623,7 @@ class ExportController(BaseController):
                 if not isinstance(element_ids, list) or len(element_ids) == 0:
                     return {"status": "error", "message": "element_ids must be a non-empty list when provided"}
                 
-                validated_ids = []
-                for element_id in element_ids:
-                    validated_id = self.validate_element_id(element_id)
-                    validated_ids.append(validated_id)
+                validated_ids = [self.validate_element_id(element_id) for element_id in element_ids]
                 
                 export_params["element_ids"] = validated_ids
             else:
@@ -678,7 +642,7 @@ class ExportController(BaseController):
                 
                 export_params["file_path"] = file_path
             
-            return self.send_command("export_to_gltf", export_params)
+            return await self.send_command("export_to_gltf", export_params)
             
         except Exception as e:
             return {"status": "error", "message": f"export_to_gltf failed: {e}"}
@@ -718,10 +682,7 @@ class ExportController(BaseController):
                 if not isinstance(element_ids, list) or len(element_ids) == 0:
                     return {"status": "error", "message": "element_ids must be a non-empty list when provided"}
                 
-                validated_ids = []
-                for element_id in element_ids:
-                    validated_id = self.validate_element_id(element_id)
-                    validated_ids.append(validated_id)
+                validated_ids = [self.validate_element_id(element_id) for element_id in element_ids]
                 
                 export_params["element_ids"] = validated_ids
             else:
@@ -749,7 +710,7 @@ class ExportController(BaseController):
                 
                 export_params["file_path"] = file_path
             
-            return self.send_command("export_to_x3d", export_params)
+            return await self.send_command("export_to_x3d", export_params)
             
         except Exception as e:
             return {"status": "error", "message": f"export_to_x3d failed: {e}"}
@@ -786,10 +747,7 @@ class ExportController(BaseController):
                 if not isinstance(element_ids, list) or len(element_ids) == 0:
                     return {"status": "error", "message": "element_ids must be a non-empty list when provided"}
                 
-                validated_ids = []
-                for element_id in element_ids:
-                    validated_id = self.validate_element_id(element_id)
-                    validated_ids.append(validated_id)
+                validated_ids = [self.validate_element_id(element_id) for element_id in element_ids]
                 
                 export_params["element_ids"] = validated_ids
             else:
@@ -808,7 +766,7 @@ class ExportController(BaseController):
                 
                 export_params["file_path"] = file_path
             
-            return self.send_command("export_production_data", export_params)
+            return await self.send_command("export_production_data", export_params)
             
         except Exception as e:
             return {"status": "error", "message": f"export_production_data failed: {e}"}
@@ -866,10 +824,7 @@ class ExportController(BaseController):
                 if not isinstance(element_ids, list) or len(element_ids) == 0:
                     return {"status": "error", "message": "element_ids must be a non-empty list when provided"}
                 
-                validated_ids = []
-                for element_id in element_ids:
-                    validated_id = self.validate_element_id(element_id)
-                    validated_ids.append(validated_id)
+                validated_ids = [self.validate_element_id(element_id) for element_id in element_ids]
                 
                 export_params["element_ids"] = validated_ids
             else:
@@ -887,7 +842,7 @@ class ExportController(BaseController):
                 
                 export_params["file_path"] = file_path
             
-            return self.send_command("export_to_fbx", export_params)
+            return await self.send_command("export_to_fbx", export_params)
             
         except Exception as e:
             return {"status": "error", "message": f"export_to_fbx failed: {e}"}
@@ -920,10 +875,7 @@ class ExportController(BaseController):
                 if not isinstance(element_ids, list) or len(element_ids) == 0:
                     return {"status": "error", "message": "element_ids must be a non-empty list when provided"}
                 
-                validated_ids = []
-                for element_id in element_ids:
-                    validated_id = self.validate_element_id(element_id)
-                    validated_ids.append(validated_id)
+                validated_ids = [self.validate_element_id(element_id) for element_id in element_ids]
                 
                 export_params["element_ids"] = validated_ids
             else:
@@ -941,7 +893,7 @@ class ExportController(BaseController):
                 
                 export_params["file_path"] = file_path
             
-            return self.send_command("export_to_webgl", export_params)
+            return await self.send_command("export_to_webgl", export_params)
             
         except Exception as e:
             return {"status": "error", "message": f"export_to_webgl failed: {e}"}
@@ -983,10 +935,7 @@ class ExportController(BaseController):
                 if not isinstance(element_ids, list) or len(element_ids) == 0:
                     return {"status": "error", "message": "element_ids must be a non-empty list when provided"}
                 
-                validated_ids = []
-                for element_id in element_ids:
-                    validated_id = self.validate_element_id(element_id)
-                    validated_ids.append(validated_id)
+                validated_ids = [self.validate_element_id(element_id) for element_id in element_ids]
                 
                 export_params["element_ids"] = validated_ids
             else:
@@ -1004,7 +953,7 @@ class ExportController(BaseController):
                 
                 export_params["file_path"] = file_path
             
-            return self.send_command("export_to_sat", export_params)
+            return await self.send_command("export_to_sat", export_params)
             
         except Exception as e:
             return {"status": "error", "message": f"export_to_sat failed: {e}"}
@@ -1047,10 +996,7 @@ class ExportController(BaseController):
                 if not isinstance(element_ids, list) or len(element_ids) == 0:
                     return {"status": "error", "message": "element_ids must be a non-empty list when provided"}
                 
-                validated_ids = []
-                for element_id in element_ids:
-                    validated_id = self.validate_element_id(element_id)
-                    validated_ids.append(validated_id)
+                validated_ids = [self.validate_element_id(element_id) for element_id in element_ids]
                 
                 export_params["element_ids"] = validated_ids
             else:
@@ -1071,7 +1017,7 @@ class ExportController(BaseController):
                 
                 export_params["file_path"] = file_path
             
-            return self.send_command("export_to_dstv", export_params)
+            return await self.send_command("export_to_dstv", export_params)
             
         except Exception as e:
             return {"status": "error", "message": f"export_to_dstv failed: {e}"}
@@ -1113,10 +1059,7 @@ class ExportController(BaseController):
                 if not isinstance(element_ids, list) or len(element_ids) == 0:
                     return {"status": "error", "message": "element_ids must be a non-empty list when provided"}
                 
-                validated_ids = []
-                for element_id in element_ids:
-                    validated_id = self.validate_element_id(element_id)
-                    validated_ids.append(validated_id)
+                validated_ids = [self.validate_element_id(element_id) for element_id in element_ids]
                 
                 export_params["element_ids"] = validated_ids
             else:
@@ -1134,7 +1077,7 @@ class ExportController(BaseController):
                 
                 export_params["file_path"] = file_path
             
-            return self.send_command("export_step_with_drillings", export_params)
+            return await self.send_command("export_step_with_drillings", export_params)
             
         except Exception as e:
             return {"status": "error", "message": f"export_step_with_drillings failed: {e}"}
@@ -1206,7 +1149,7 @@ class ExportController(BaseController):
                 
                 export_params["file_path"] = file_path
             
-            return self.send_command("export_btl_for_nesting", export_params)
+            return await self.send_command("export_btl_for_nesting", export_params)
             
         except Exception as e:
             return {"status": "error", "message": f"export_btl_for_nesting failed: {e}"}
\ No newline at end of file
@@ -1,80 +1,134 @@
 """
 Geometry controller for geometry operations
 """
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 from .base_controller import BaseController
 
+if TYPE_CHECKING:
+    from .element_controller import ElementController
+
+# Scalar dimensions fetched together by get_element_dimensions
+ELEMENT_DIMENSIONS = ("width", "height", "length", "volume", "weight")
+
 class GeometryController(BaseController):
     """Controller for geometry operations"""
     
     def __init__(self) -> None:
         super().__init__("GeometryController")
+        self._element_controller: Optional["ElementController"] = None
     
     async def get_element_info(self, element_id: int) -> Dict[str, Any]:
         """Get detailed element information - proxy to ElementController"""
-        from .element_controller import ElementController
-        element_controller = ElementController()
-        return await element_controller.get_element_info(element_id)
+        if self._element_controller is None:
+            from .element_controller import ElementController
+            self._element_controller = ElementController()
+        return await self._element_controller.get_element_info(element_id)
     
     async def get_element_width(self, element_id: int) -> Dict[str, Any]:
         """Get element width"""
         element_id = self.validate_element_id(element_id)
-        return self.send_command("get_element_width", {"element_id": element_id})
+        return await self.send_command("get_element_width", {"element_id": element_id})
     
     async def get_element_height(self, element_id: int) -> Dict[str, Any]:
         """Get element height"""
         element_id = self.validate_element_id(element_id)
-        return self.send_command("get_element_height", {"element_id": element_id})
+        return await self.send_command("get_element_height", {"element_id": element_id})
     
     async def get_element_length(self, element_id: int) -> Dict[str, Any]:
         """Get element length"""
         element_id = self.validate_element_id(element_id)
-        return self.send_command("get_element_length", {"element_id": element_id})
+        return await self.send_command("get_element_length", {"element_id": element_id})
     
     async def get_element_volume(self, element_id: int) -> Dict[str, Any]:
         """Get element volume"""
         element_id = self.validate_element_id(element_id)
-        return self.send_command("get_element_volume", {"element_id": element_id})
+        return await self.send_command("get_element_volume", {"element_id": element_id})
+    
+    async def get_element_volumes(self, element_ids: List[int]) -> Dict[str, Any]:
+        """Get volumes of several elements with a single bridge request"""
+        if not isinstance(element_ids, list):
+            raise ValueError("element_ids must be a list")
+        
+        validated_ids = [self.validate_element_id(eid) for eid in element_ids]
+        if not validated_ids:
+            return {"status": "ok", "element_ids": [], "volumes": [], "failed_elements": []}
+        
+        return await self.send_command("get_element_volumes", {"element_ids": validated_ids})
     
     async def get_element_weight(self, element_id: int) -> Dict[str, Any]:
         """Get element weight"""
         element_id = self.validate_element_id(element_id)
-        return self.send_command("get_element_weight", {"element_id": element_id})
+        return await self.send_command("get_element_weight", {"element_id": element_id})
+    
+    async def get_element_dimensions(self, element_id: int) -> Dict[str, Any]:
+        """Get width, height, length, volume and weight in one batched bridge request"""
+        element_id = self.validate_element_id(element_id)
+        
+        response = await self.send_batch([
+            {"operation": f"get_element_{dimension}", "args": {"element_id": element_id}}
+            for dimension in ELEMENT_DIMENSIONS
+        ])
+        if not isinstance(response.get("data"), list):
+            return response
+        
+        # Each batch entry is a dispatcher response - unwrap it to the plain value
+        dimensions: Dict[str, Any] = {}
+        failed: List[Dict[str, Any]] = []
+        for dimension, result in zip(ELEMENT_DIMENSIONS, response["data"]):
+            value = None
+            message = result.get("message") if isinstance(result, dict) else None
+            if isinstance(result, dict) and result.get("status") in ("success", "ok"):
+                value = result.get("data")
+                # The batch wraps the controller response, its own error message sits in data
+                if isinstance(value, dict):
+                    message = value.get("message", message)
+                    value = value.get(dimension)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                dimensions[dimension] = float(value)
+            else:
+                failed.append({"dimension": dimension, "message": message or f"No {dimension} value returned"})
+        
+        return {
+            "status": "error" if failed else "ok",
+            "element_id": element_id,
+            "dimensions": dimensions,
+            "failed": failed
+        }
     
     async def get_element_xl(self, element_id: int) -> Dict[str, Any]:
         """Get element XL vector (length direction)"""
         element_id = self.validate_element_id(element_id)
-        return self.send_command("get_element_xl", {"element_id": element_id})
+        return await self.send_command("get_element_xl", {"element_id": element_id})
     
     async def get_element_yl(self, element_id: int) -> Dict[str, Any]:
         """Get element YL vector (width direction)"""
         element_id = self.validate_element_id(element_id)
-        return self.send_command("get_element_yl", {"element_id": element_id})
+        return await self.send_command("get_element_yl", {"element_id": element_id})
     
     async def get_element_zl(self, element_id: int) -> Dict[str, Any]:
         """Get element ZL vector (height direction)"""
         element_id = self.validate_element_id(element_id)
-        return self.send_command("get_element_zl", {"element_id": element_id})
+        return await self.send_command("get_element_zl", {"element_id": element_id})
     
     async def get_element_p1(self, element_id: int) -> Dict[str, Any]:
         """Get element P1 point (start point)"""
         element_id = self.validate_element_id(element_id)
-        return self.send_command("get_element_p1", {"element_id": element_id})
+        return await self.send_command("get_element_p1", {"element_id": element_id})
     
     async def get_element_p2(self, element_id: int) -> Dict[str, Any]:
         """Get element P2 point (end point)"""
         element_id = self.validate_element_id(element_id)
-        return self.send_command("get_element_p2", {"element_id": element_id})
+        return await self.send_command("get_element_p2", {"element_id": element_id})
     
     async def get_element_p3(self, element_id: int) -> Dict[str, Any]:
         """Get element P3 point (orientation point)"""
         element_id = self.validate_element_id(element_id)
-        return self.send_command("get_element_p3", {"element_id": element_id})
+        return await self.send_command("get_element_p3", {"element_id": element_id})
     
     async def get_center_of_gravity(self, element_id: int) -> Dict[str, Any]:
         """Get center of gravity for a single element"""
         element_id = self.validate_element_id(element_id)
-        return self.send_command("get_center_of_gravity", {"element_id": element_id})
+        return await self.send_command("get_center_of_gravity", {"element_id": element_id})
     
     async def get_center_of_gravity_for_list(self, element_ids: list) -> Dict[str, Any]:
         """Get center of gravity for multiple elements combined"""
@@ -84,19 +138,19 @@ class GeometryController(BaseController):
         # Validate all element IDs
         validated_ids = [self.validate_element_id(eid) for eid in element_ids]
         
-        return self.send_command("get_center_of_gravity_for_list", {"element_ids": validated_ids})
+        return await self.send_command("get_center_of_gravity_for_list", {"element_ids": validated_ids})
     
     async def get_element_vertices(self, element_id: int) -> Dict[str, Any]:
         """Get all vertices (corner points) of an element"""
         element_id = self.validate_element_id(element_id)
-        return self.send_command("get_element_vertices", {"element_id": element_id})
+        return await self.send_command("get_element_vertices", {"element_id": element_id})
     
     async def get_minimum_distance_between_elements(self, first_element_id: int, second_element_id: int) -> Dict[str, Any]:
         """Get minimum distance between two elements"""
         first_element_id = self.validate_element_id(first_element_id)
         second_element_id = self.validate_element_id(second_element_id)
         
-        return self.send_command("get_minimum_distance_between_elements", {
+        return await self.send_command("get_minimum_distance_between_elements", {
             "first_element_id": first_element_id,
             "second_element_id": second_element_id
         })
@@ -110,7 +164,7 @@ class GeometryController(BaseController):
             if validated_point is None:
                 return {"status": "error", "message": "reference_point must be valid 3D coordinates"}
             
-            return self.send_command("get_closest_point_on_element", {
+            return await self.send_command("get_closest_point_on_element", {
                 "element_id": element_id,
                 "reference_point": validated_point
             })
@@ -123,17 +177,17 @@ class GeometryController(BaseController):
     async def get_element_facets(self, element_id: int) -> Dict[str, Any]:
         """Get all facets (faces) of an element"""
         element_id = self.validate_element_id(element_id)
-        return self.send_command("get_element_facets", {"element_id": element_id})
+        return await self.send_command("get_element_facets", {"element_id": element_id})
     
     async def get_element_reference_face_area(self, element_id: int) -> Dict[str, Any]:
         """Get reference face area of an element"""
         element_id = self.validate_element_id(element_id)
-        return self.send_command("get_element_reference_face_area", {"element_id": element_id})
+        return await self.send_command("get_element_reference_face_area", {"element_id": element_id})
     
     async def get_total_area_of_all_faces(self, element_id: int) -> Dict[str, Any]:
         """Get total surface area of all faces of an element"""
         element_id = self.validate_element_id(element_id)
-        return self.send_command("get_total_area_of_all_faces", {"element_id": element_id})
+        return await self.send_command("get_total_area_of_all_faces", {"element_id": element_id})
     
     async def rotate_elements(self, element_ids: list, origin: list, rotation_axis: list, rotation_angle: float) -> Dict[str, Any]:
         """Rotate elements around an axis"""
@@ -149,7 +203,7 @@ class GeometryController(BaseController):
         # Validate all element IDs
         validated_ids = [self.validate_element_id(eid) for eid in element_ids]
         
-        return self.send_command("rotate_elements", {
+        return await self.send_command("rotate_elements", {
             "element_ids": validated_ids,
             "origin": origin,
             "rotation_axis": rotation_axis,
@@ -168,7 +222,7 @@ class GeometryController(BaseController):
         # Validate all element IDs
         validated_ids = [self.validate_element_id(eid) for eid in element_ids]
         
-        return self.send_command("apply_global_scale", {
+        return await self.send_command("apply_global_scale", {
             "element_ids": validated_ids,
             "scale": float(scale),
             "origin": origin
@@ -182,7 +236,7 @@ class GeometryController(BaseController):
         # Validate all element IDs
         validated_ids = [self.validate_element_id(eid) for eid in element_ids]
         
-        return self.send_command("invert_model", {"element_ids": validated_ids})
+        return await self.send_command("invert_model", {"element_ids": validated_ids})
     
     async def rotate_height_axis_90(self, element_ids: list) -> Dict[str, Any]:
         """Rotate element height axis by 90 degrees"""
@@ -192,7 +246,7 @@ class GeometryController(BaseController):
         # Validate all element IDs
         validated_ids = [self.validate_element_id(eid) for eid in element_ids]
         
-        return self.send_command("rotate_height_axis_90", {"element_ids": validated_ids})
+        return await self.send_command("rotate_height_axis_90", {"element_ids": validated_ids})
     
     async def rotate_length_axis_90(self, element_ids: list) -> Dict[str, Any]:
         """Rotate element length axis by 90 degrees"""
@@ -202,7 +256,7 @@ class GeometryController(BaseController):
         # Validate all element IDs
         validated_ids = [self.validate_element_id(eid) for eid in element_ids]
         
-        return self.send_command("rotate_length_axis_90", {"element_ids": validated_ids})
+        return await self.send_command("rotate_length_axis_90", {"element_ids": validated_ids})
     
     async def get_element_type(self, aElementId: int) -> dict:
         """
@@ -219,7 +273,7 @@ class GeometryController(BaseController):
             lValidatedId = self.validate_element_id(aElementId)
             
             # Command senden
-            return self.send_command("get_element_type", {
+            return await self.send_command("get_element_type", {
                 "element_id": lValidatedId
             })
             
@@ -244,7 +298,7 @@ class GeometryController(BaseController):
             lValidatedIds = [self.validate_element_id(lId) for lId in aElementIds]
             
             # Command senden
-            return self.send_command("calculate_total_volume", {
+            return await self.send_command("calculate_total_volume", {
                 "element_ids": lValidatedIds
             })
             
@@ -269,7 +323,7 @@ class GeometryController(BaseController):
             lValidatedIds = [self.validate_element_id(lId) for lId in aElementIds]
             
             # Command senden
-            return self.send_command("calculate_total_weight", {
+            return await self.send_command("calculate_total_weight", {
                 "element_ids": lValidatedIds
             })
             
@@ -281,19 +335,33 @@ class GeometryController(BaseController):
         try:
             validated_id = self.validate_element_id(element_id)
             
-            return self.send_command("get_bounding_box", {
+            return await self.send_command("get_bounding_box", {
                 "element_id": validated_id
             })
             
         except Exception as e:
             return {"status": "error", "message": f"get_bounding_box failed: {e}"}
     
+    async def get_bounding_boxes(self, element_ids: List[int]) -> Dict[str, Any]:
+        """Get bounding boxes of several elements with a single bridge request"""
+        try:
+            validated_ids = [self.validate_element_id(eid) for eid in element_ids]
+            if not validated_ids:
+                return {"status": "ok", "element_ids": [], "bounding_boxes": [], "failed_elements": []}
+            
+            return await self.send_command("get_bounding_boxes", {
+                "element_ids": validated_ids
+            })
+            
+        except Exception as e:
+            return {"status": "error", "message": f"get_bounding_boxes failed: {e}"}
+    
     async def get_element_outline(self, element_id: int) -> Dict[str, Any]:
         """Get the 2D outline/contour of an element projected to a plane"""
         try:
             validated_id = self.validate_element_id(element_id)
             
-            return self.send_command("get_element_outline", {
+            return await self.send_command("get_element_outline", {
                 "element_id": validated_id
             })
             
@@ -326,7 +394,7 @@ class GeometryController(BaseController):
                 "section_plane_normal": validated_normal
             }
             
-            return self.send_command("get_section_outline", args)
+            return await self.send_command("get_section_outline", args)
             
         except Exception as e:
             return {"status": "error", "message": f"get_section_outline failed: {e}"}
@@ -348,7 +416,7 @@ class GeometryController(BaseController):
                 "keep_originals": keep_originals
             }
             
-            return self.send_command("intersect_elements", args)
+            return await self.send_command("intersect_elements", args)
             
         except Exception as e:
             return {"status": "error", "message": f"intersect_elements failed: {e}"}
@@ -386,7 +454,7 @@ class GeometryController(BaseController):
                 "keep_originals": keep_originals
             }
             
-            return self.send_command("subtract_elements", args)
+            return await self.send_command("subtract_elements", args)
             
         except Exception as e:
             return {"status": "error", "message": f"subtract_elements failed: {e}"}
@@ -420,7 +488,7 @@ class GeometryController(BaseController):
                 "keep_originals": keep_originals
             }
             
-            return self.send_command("unite_elements", args)
+            return await self.send_command("unite_elements", args)
             
         except Exception as e:
             return {"status": "error", "message": f"unite_elements failed: {e}"}
@@ -440,7 +508,7 @@ class GeometryController(BaseController):
                 "element_id": validated_element_id
             }
             
-            return self.send_command("project_point_to_element", args)
+            return await self.send_command("project_point_to_element", args)
             
         except Exception as e:
             return {"status": "error", "message": f"project_point_to_element failed: {e}"}
@@ -452,16 +520,13 @@ class GeometryController(BaseController):
             if not isinstance(element_ids, list) or len(element_ids) == 0:
                 return {"status": "error", "message": "element_ids must be a non-empty list"}
             
-            validated_ids = []
-            for element_id in element_ids:
-                validated_id = self.validate_element_id(element_id)
-                validated_ids.append(validated_id)
+            validated_ids = [self.validate_element_id(element_id) for element_id in element_ids]
             
             # Validate include_material_properties parameter
             if not isinstance(include_material_properties, bool):
                 include_material_properties = True
             
-            return self.send_command("calculate_center_of_mass", {
+            return await self.send_command("calculate_center_of_mass", {
                 "element_ids": validated_ids,
                 "include_material_properties": include_material_properties
             })
@@ -484,7 +549,7 @@ class GeometryController(BaseController):
             if tolerance < 0:
                 return {"status": "error", "message": "Tolerance must be non-negative"}
             
-            return self.send_command("check_collisions", {
+            return await self.send_command("check_collisions", {
                 "element_ids": validated_ids,
                 "tolerance": tolerance
             })
@@ -545,7 +610,7 @@ class GeometryController(BaseController):
                     if key not in valid_load_keys:
                         return {"status": "error", "message": f"Invalid load condition key '{key}'. Valid keys: {valid_load_keys}"}
             
-            return self.send_command("validate_joints", {
+            return await self.send_command("validate_joints", {
                 "element_ids": validated_ids,
                 "joint_type": joint_type,
                 "load_conditions": load_conditions or {},
@@ -49,7 +49,7 @@ class ImportController(BaseController):
             if insert_position:
                 import_params["insert_position"] = insert_position
             
-            return self.send_command("import_from_step", import_params)
+            return await self.send_command("import_from_step", import_params)
             
         except Exception as e:
             return {"status": "error", "message": f"import_from_step failed: {e}"}
@@ -93,7 +93,7 @@ class ImportController(BaseController):
             if insert_position:
                 import_params["insert_position"] = insert_position
             
-            return self.send_command("import_from_sat", import_params)
+            return await self.send_command("import_from_sat", import_params)
             
         except Exception as e:
             return {"status": "error", "message": f"import_from_sat failed: {e}"}
@@ -125,7 +125,7 @@ class ImportController(BaseController):
                 "scale_factor": float(scale_factor)
             }
             
-            return self.send_command("import_from_rhino", import_params)
+            return await self.send_command("import_from_rhino", import_params)
             
         except Exception as e:
             return {"status": "error", "message": f"import_from_rhino failed: {e}"}
@@ -158,7 +158,7 @@ class ImportController(BaseController):
                 "import_processing": bool(import_processing)
             }
             
-            return self.send_command("import_from_btl", import_params)
+            return await self.send_command("import_from_btl", import_params)
             
         except Exception as e:
             return {"status": "error", "message": f"import_from_btl failed: {e}"}
@@ -39,7 +39,7 @@ class ListController(BaseController):
             if filter_criteria is not None and not isinstance(filter_criteria, dict):
                 return {"status": "error", "message": "filter_criteria must be a dictionary"}
             
-            return self.send_command("create_element_list", {
+            return await self.send_command("create_element_list", {
                 "element_ids": validated_ids,
                 "include_properties": include_properties,
                 "include_materials": include_materials,
@@ -101,7 +101,7 @@ class ListController(BaseController):
                 if cost_database not in valid_cost_databases:
                     return {"status": "error", "message": f"Invalid cost_database. Must be one of: {valid_cost_databases}"}
             
-            return self.send_command("generate_material_list", {
+            return await self.send_command("generate_material_list", {
                 "element_ids": validated_ids,
                 "include_waste": bool(include_waste),
                 "waste_factor": float(waste_factor),
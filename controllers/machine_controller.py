@@ -31,7 +31,7 @@ class MachineController(BaseController):
                 return {"status": "error", "message": "Production list ID must be a positive integer"}
             
             # Send command
-            return self.send_command("check_production_list_discrepancies", {
+            return await self.send_command("check_production_list_discrepancies", {
                 "production_list_id": production_list_id
             })
             
@@ -46,7 +46,7 @@ class MaterialController(BaseController):
                     return {"status": "error", "message": "color_id must be an integer between 1 and 255"}
                 material_data["color_id"] = color_id
             
-            return self.send_command("create_material", material_data)
+            return await self.send_command("create_material", material_data)
             
         except Exception as e:
             return {"status": "error", "message": f"create_material failed: {e}"}
@@ -57,7 +57,7 @@ class MaterialController(BaseController):
             if not isinstance(material_name, str) or not material_name.strip():
                 return {"status": "error", "message": "material_name must be a non-empty string"}
             
-            return self.send_command("get_material_properties", {"material_name": material_name.strip()})
+            return await self.send_command("get_material_properties", {"material_name": material_name.strip()})
             
         except Exception as e:
             return {"status": "error", "message": f"get_material_properties failed: {e}"}
@@ -65,7 +65,7 @@ class MaterialController(BaseController):
     async def list_available_materials(self) -> Dict[str, Any]:
         """List all available materials in the project"""
         try:
-            return self.send_command("list_available_materials", {})
+            return await self.send_command("list_available_materials", {})
             
         except Exception as e:
             return {"status": "error", "message": f"list_available_materials failed: {e}"}
@@ -79,7 +79,7 @@ class MaterialController(BaseController):
             if not isinstance(density, (int, float)) or density <= 0:
                 return {"status": "error", "message": "density must be a positive number (kg/m³)"}
             
-            return self.send_command("set_material_density", {
+            return await self.send_command("set_material_density", {
                 "material_name": material_name.strip(),
                 "density": float(density)
             })
@@ -97,7 +97,7 @@ class MaterialController(BaseController):
             if not isinstance(thermal_conductivity, (int, float)) or thermal_conductivity < 0:
                 return {"status": "error", "message": "thermal_conductivity must be a non-negative number (W/mK)"}
             
-            return self.send_command("set_material_thermal_properties", {
+            return await self.send_command("set_material_thermal_properties", {
                 "material_name": material_name.strip(),
                 "thermal_conductivity": float(thermal_conductivity)
             })
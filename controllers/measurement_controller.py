@@ -109,8 +109,8 @@ class MeasurementController(BaseController):
                 "vector1_magnitude": magnitude1,
                 "vector2_magnitude": magnitude2,
                 "cos_angle": cos_angle,
-                "is_perpendicular": abs(dot_product) < 1e-10,  # Nearly zero dot product
-                "is_parallel": abs(abs(cos_angle) - 1.0) < 1e-10,  # cos(angle) ≈ ±1
+                "is_perpendicular": math.isclose(dot_product, 0.0, rel_tol=0.0, abs_tol=1e-10),  # Nearly zero dot product
+                "is_parallel": math.isclose(abs(cos_angle), 1.0, rel_tol=0.0, abs_tol=1e-10),  # cos(angle) ≈ ±1
                 "units": {
                     "angle": "degrees",
                     "vectors": "mm"
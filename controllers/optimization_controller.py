@@ -48,7 +48,7 @@ class OptimizationController(BaseController):
             if priority_mode not in valid_modes:
                 return {"status": "error", "message": f"Invalid priority_mode. Must be one of: {valid_modes}"}
             
-            return self.send_command("optimize_cutting_list", {
+            return await self.send_command("optimize_cutting_list", {
                 "element_ids": validated_ids,
                 "stock_lengths": stock_lengths,
                 "optimization_algorithm": optimization_algorithm,
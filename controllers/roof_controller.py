@@ -26,15 +26,13 @@ class RoofController(BaseController):
         """
         try:
             # Validate element IDs
-            validated_ids = []
-            for eid in element_ids:
-                validated_ids.append(self.validate_element_id(eid))
+            validated_ids = [self.validate_element_id(eid) for eid in element_ids]
             
             if not validated_ids:
                 return {"status": "error", "message": "No valid element IDs provided"}
             
             # Send command
-            return self.send_command("get_roof_surfaces", {
+            return await self.send_command("get_roof_surfaces", {
                 "element_ids": validated_ids
             })
             
@@ -56,15 +54,13 @@ class RoofController(BaseController):
         """
         try:
             # Validate element IDs
-            validated_ids = []
-            for eid in roof_element_ids:
-                validated_ids.append(self.validate_element_id(eid))
+            validated_ids = [self.validate_element_id(eid) for eid in roof_element_ids]
             
             if not validated_ids:
                 return {"status": "error", "message": "No valid roof element IDs provided"}
             
             # Send command
-            return self.send_command("calculate_roof_area", {
+            return await self.send_command("calculate_roof_area", {
                 "roof_element_ids": validated_ids
             })
             
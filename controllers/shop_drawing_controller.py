@@ -34,7 +34,7 @@ class ShopDrawingController(BaseController):
             final_section_params = section_params if section_params is not None else {}
             
             # Send command
-            return self.send_command("add_wall_section_x", {
+            return await self.send_command("add_wall_section_x", {
                 "wall_id": validated_id,
                 "section_params": final_section_params
             })
@@ -65,7 +65,7 @@ class ShopDrawingController(BaseController):
             final_section_params = section_params if section_params is not None else {}
             
             # Send command
-            return self.send_command("add_wall_section_y", {
+            return await self.send_command("add_wall_section_y", {
                 "wall_id": validated_id,
                 "section_params": final_section_params
             })
@@ -109,7 +109,7 @@ class ShopDrawingController(BaseController):
             final_section_params = section_params if section_params is not None else {}
             
             # Send command
-            return self.send_command("add_wall_section_vertical", {
+            return await self.send_command("add_wall_section_vertical", {
                 "wall_id": validated_id,
                 "position_vector": position_vector,
                 "section_params": final_section_params
@@ -164,7 +164,7 @@ class ShopDrawingController(BaseController):
                     file_path += expected_ext
             
             # Send command
-            return self.send_command("export_2d_wireframe", {
+            return await self.send_command("export_2d_wireframe", {
                 "clipboard_number": clipboard_number,
                 "with_layout": bool(with_layout),
                 "export_format": export_format,
@@ -53,7 +53,7 @@ class TransformationController(BaseController):
             "rotation_angle": angle
         }
         
-        return self.send_command("rotate_elements", args)
+        return await self.send_command("rotate_elements", args)
     
     async def apply_global_scale(self, element_ids: List[int], scale: float, origin: List[float]) -> Dict[str, Any]:
         """Applies global scaling to elements"""
@@ -88,4 +88,4 @@ class TransformationController(BaseController):
             "origin": validated_origin
         }
         
-        return self.send_command("apply_global_scale", args)
+        return await self.send_command("apply_global_scale", args)
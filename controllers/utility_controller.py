@@ -23,7 +23,7 @@ class UtilityController(BaseController):
         """
         try:
             # Send command
-            return self.send_command("disable_auto_display_refresh", {})
+            return await self.send_command("disable_auto_display_refresh", {})
             
         except Exception as e:
             return {"status": "error", "message": f"disable_auto_display_refresh failed: {e}"}
@@ -40,7 +40,7 @@ class UtilityController(BaseController):
         """
         try:
             # Send command  
-            return self.send_command("enable_auto_display_refresh", {})
+            return await self.send_command("enable_auto_display_refresh", {})
             
         except Exception as e:
             return {"status": "error", "message": f"enable_auto_display_refresh failed: {e}"}
@@ -61,7 +61,7 @@ class UtilityController(BaseController):
                 return {"status": "error", "message": "message must be a non-empty string"}
             
             # Send command
-            return self.send_command("print_error", {
+            return await self.send_command("print_error", {
                 "message": message.strip()
             })
             
@@ -84,7 +84,7 @@ class UtilityController(BaseController):
                 return {"status": "error", "message": "message must be a non-empty string"}
             
             # Send command
-            return self.send_command("print_warning", {
+            return await self.send_command("print_warning", {
                 "message": message.strip()
             })
             
@@ -100,7 +100,7 @@ class UtilityController(BaseController):
         """
         try:
             # Send command
-            return self.send_command("get_3d_file_path", {})
+            return await self.send_command("get_3d_file_path", {})
             
         except Exception as e:
             return {"status": "error", "message": f"get_3d_file_path failed: {e}"}
@@ -114,7 +114,7 @@ class UtilityController(BaseController):
         """
         try:
             # Send command
-            return self.send_command("get_project_data", {})
+            return await self.send_command("get_project_data", {})
             
         except Exception as e:
             return {"status": "error", "message": f"get_project_data failed: {e}"}
@@ -128,7 +128,7 @@ class UtilityController(BaseController):
         """
         try:
             # Send command
-            return self.send_command("get_cadwork_version_info", {})
+            return await self.send_command("get_cadwork_version_info", {})
             
         except Exception as e:
             return {"status": "error", "message": f"get_cadwork_version_info failed: {e}"}
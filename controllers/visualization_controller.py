@@ -2,6 +2,7 @@
 Visualization Controller for Cadwork MCP Server
 Manages colors, transparency and visibility of elements
 """
+from collections import defaultdict
 from typing import Dict, Any, List, Optional
 from .base_controller import BaseController
 
@@ -33,7 +34,7 @@ class VisualizationController(BaseController):
                 return {"status": "error", "message": "color_id must be an integer between 1 and 255"}
             
             # Send command
-            return self.send_command("set_color", {
+            return await self.send_command("set_color", {
                 "element_ids": validated_ids,
                 "color_id": color_id
             })
@@ -63,7 +64,7 @@ class VisualizationController(BaseController):
                 return {"status": "error", "message": "visible must be a boolean (True/False)"}
             
             # Send command
-            return self.send_command("set_visibility", {
+            return await self.send_command("set_visibility", {
                 "element_ids": validated_ids,
                 "visible": visible
             })
@@ -93,7 +94,7 @@ class VisualizationController(BaseController):
                 return {"status": "error", "message": "transparency must be an integer between 0 and 100"}
             
             # Send command
-            return self.send_command("set_transparency", {
+            return await self.send_command("set_transparency", {
                 "element_ids": validated_ids,
                 "transparency": transparency
             })
@@ -101,6 +102,79 @@ class VisualizationController(BaseController):
         except Exception as e:
             return {"status": "error", "message": f"set_transparency failed: {e}"}
     
+    async def set_colors(self, element_ids: List[int], color_ids: List[int]) -> Dict[str, Any]:
+        """
+        Set individual colors for many elements with a single request
+        
+        Args:
+            element_ids: List of element IDs
+            color_ids: Color ID per element (1-255), same length as element_ids
+        
+        Returns:
+            dict: Status of operation
+        """
+        try:
+            # Validation
+            if not isinstance(element_ids, list) or not element_ids:
+                return {"status": "error", "message": "element_ids must be a non-empty list"}
+            
+            if not isinstance(color_ids, list) or len(color_ids) != len(element_ids):
+                return {"status": "error", "message": "color_ids must be a list with one color per element"}
+            
+            # Nach Farbe gruppieren - ein Cadwork-Aufruf pro Farbe statt pro Element
+            groups: Dict[int, List[int]] = defaultdict(list)
+            for element_id, color_id in zip(element_ids, color_ids):
+                if not isinstance(color_id, int) or color_id < 1 or color_id > 255:
+                    return {"status": "error", "message": "color_id must be an integer between 1 and 255"}
+                groups[color_id].append(self.validate_element_id(element_id))
+            
+            # Send command
+            return await self.send_command("set_colors", {
+                "color_groups": [
+                    {"color_id": color_id, "element_ids": ids}
+                    for color_id, ids in groups.items()
+                ]
+            })
+            
+        except Exception as e:
+            return {"status": "error", "message": f"set_colors failed: {e}"}
+    
+    async def set_transparencies(self, element_ids: List[int], transparencies: List[int]) -> Dict[str, Any]:
+        """
+        Set individual transparency values for many elements with a single request
+        
+        Args:
+            element_ids: List of element IDs
+            transparencies: Transparency per element (0-100), same length as element_ids
+        
+        Returns:
+            dict: Status of operation
+        """
+        try:
+            # Validation
+            if not isinstance(element_ids, list) or not element_ids:
+                return {"status": "error", "message": "element_ids must be a non-empty list"}
+            
+            if not isinstance(transparencies, list) or len(transparencies) != len(element_ids):
+                return {"status": "error", "message": "transparencies must be a list with one value per element"}
+            
+            groups: Dict[int, List[int]] = defaultdict(list)
+            for element_id, transparency in zip(element_ids, transparencies):
+                if not isinstance(transparency, int) or transparency < 0 or transparency > 100:
+                    return {"status": "error", "message": "transparency must be an integer between 0 and 100"}
+                groups[transparency].append(self.validate_element_id(element_id))
+            
+            # Send command
+            return await self.send_command("set_transparencies", {
+                "transparency_groups": [
+                    {"transparency": transparency, "element_ids": ids}
+                    for transparency, ids in groups.items()
+                ]
+            })
+            
+        except Exception as e:
+            return {"status": "error", "message": f"set_transparencies failed: {e}"}
+    
     async def get_color(self, element_id: int) -> Dict[str, Any]:
         """
         Get color of an element
@@ -116,7 +190,7 @@ class VisualizationController(BaseController):
             validated_id = self.validate_element_id(element_id)
             
             # Send command
-            return self.send_command("get_color", {
+            return await self.send_command("get_color", {
                 "element_id": validated_id
             })
             
@@ -138,7 +212,7 @@ class VisualizationController(BaseController):
             validated_id = self.validate_element_id(element_id)
             
             # Send command
-            return self.send_command("get_transparency", {
+            return await self.send_command("get_transparency", {
                 "element_id": validated_id
             })
             
@@ -154,7 +228,7 @@ class VisualizationController(BaseController):
         """
         try:
             # Send command
-            return self.send_command("show_all_elements", {})
+            return await self.send_command("show_all_elements", {})
             
         except Exception as e:
             return {"status": "error", "message": f"show_all_elements failed: {e}"}
@@ -168,7 +242,7 @@ class VisualizationController(BaseController):
         """
         try:
             # Send command
-            return self.send_command("hide_all_elements", {})
+            return await self.send_command("hide_all_elements", {})
             
         except Exception as e:
             return {"status": "error", "message": f"hide_all_elements failed: {e}"}
@@ -182,7 +256,7 @@ class VisualizationController(BaseController):
         """
         try:
             # Send command
-            return self.send_command("refresh_display", {})
+            return await self.send_command("refresh_display", {})
             
         except Exception as e:
             return {"status": "error", "message": f"refresh_display failed: {e}"}
@@ -196,7 +270,7 @@ class VisualizationController(BaseController):
         """
         try:
             # Send command
-            return self.send_command("get_visible_element_count", {})
+            return await self.send_command("get_visible_element_count", {})
             
         except Exception as e:
             return {"status": "error", "message": f"get_visible_element_count failed: {e}"}
@@ -276,7 +350,7 @@ class VisualizationController(BaseController):
                     return {"status": "error", "message": f"Unknown filter criteria key: {key}"}
             
             # Send command
-            return self.send_command("create_visual_filter", {
+            return await self.send_command("create_visual_filter", {
                 "filter_name": filter_name.strip(),
                 "filter_criteria": validated_criteria,
                 "visual_properties": validated_visuals
@@ -328,7 +402,7 @@ class VisualizationController(BaseController):
                 args["element_ids"] = validated_ids
             
             # Send command
-            return self.send_command("apply_color_scheme", args)
+            return await self.send_command("apply_color_scheme", args)
             
         except Exception as e:
             return {"status": "error", "message": f"apply_color_scheme failed: {e}"}
@@ -383,7 +457,7 @@ class VisualizationController(BaseController):
             if movement_path not in valid_paths:
                 return {"status": "error", "message": f"Invalid movement_path. Must be one of: {valid_paths}"}
             
-            return self.send_command("create_assembly_animation", {
+            return await self.send_command("create_assembly_animation", {
                 "element_ids": validated_ids,
                 "animation_type": animation_type,
                 "duration": float(duration),
@@ -449,7 +523,7 @@ class VisualizationController(BaseController):
             if not isinstance(camera_name, str) or not camera_name.strip():
                 return {"status": "error", "message": "camera_name must be a non-empty string"}
             
-            return self.send_command("set_camera_position", {
+            return await self.send_command("set_camera_position", {
                 "position": position,
                 "target": target,
                 "up_vector": up_vector,
@@ -532,7 +606,7 @@ class VisualizationController(BaseController):
             if resolution not in valid_resolutions:
                 return {"status": "error", "message": f"Invalid resolution. Must be one of: {valid_resolutions}"}
             
-            return self.send_command("create_walkthrough", {
+            return await self.send_command("create_walkthrough", {
                 "waypoints": validated_waypoints,
                 "duration": float(duration),
                 "camera_height": float(camera_height),
@@ -1,14 +1,42 @@
 """
 Cadwork connection management
 """
+import asyncio
 import socket
 import json
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, List, Optional
 from .logging import log_info, log_error
 
+# Use orjson to decode responses when available, it is considerably faster
+# than the stdlib parser for large element lists. Encoding stays on the stdlib
+# so NaN/Infinity are sent exactly as before, and payloads orjson rejects
+# (NaN/Infinity written by a stdlib bridge) fall back to json.loads.
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+except ImportError:
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    return json.dumps(obj).encode('utf-8')
+
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 53002
 SOCKET_TIMEOUT = 30.0
+# The bridge accepts and serves one connection at a time. Commands are
+# serialized here so a queued one cannot time out in the listen backlog
+# and then still be executed by the bridge after the caller gave up.
+MAX_CONCURRENT_COMMANDS = 1
+# Bridge operation that runs a list of commands in one round trip
+BATCH_OPERATION = "batch"
 
 class CadworkConnection:
     """Manages connection to Cadwork bridge plugin"""
@@ -16,6 +44,7 @@ class CadworkConnection:
     def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
         self.host = host
         self.port = port
+        self._command_slots = asyncio.Semaphore(MAX_CONCURRENT_COMMANDS)
     
     def send_command(self, operation: str, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Send command to Cadwork and return response"""
@@ -27,6 +56,7 @@ class CadworkConnection:
         log_info(f"Sending command: {operation}")
         
         sock = None
+        start_time = time.perf_counter()
         try:
             # Create and configure socket
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -34,14 +64,15 @@ class CadworkConnection:
             sock.connect((self.host, self.port))
             
             # Send command
-            command_bytes = json.dumps(command).encode('utf-8')
+            command_bytes = _dumps(command)
             sock.sendall(command_bytes)
             
             # Receive response
             response_data = self._receive_response(sock)
-            response: Dict[str, Any] = json.loads(response_data.decode('utf-8'))
+            response: Dict[str, Any] = _loads(response_data)
             
-            log_info(f"Command {operation} completed with status: {response.get('status', 'unknown')}")
+            elapsed_ms = (time.perf_counter() - start_time) * 1000.0
+            log_info(f"Command {operation} completed with status: {response.get('status', 'unknown')} ({elapsed_ms:.1f} ms)")
             return response
             
         except socket.timeout:
@@ -67,6 +98,24 @@ class CadworkConnection:
                 except Exception:
                     pass
     
+    async def send_command_async(self, operation: str, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Send command from a worker thread so the event loop is not blocked"""
+        async with self._command_slots:
+            return await asyncio.to_thread(self.send_command, operation, args)
+    
+    def send_batch(self, commands: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Send several commands in one request, results come back in order"""
+        batch = [
+            {"operation": command["operation"], "args": command.get("args") or {}}
+            for command in commands
+        ]
+        return self.send_command(BATCH_OPERATION, {"commands": batch})
+    
+    async def send_batch_async(self, commands: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Send batch from a worker thread so the event loop is not blocked"""
+        async with self._command_slots:
+            return await asyncio.to_thread(self.send_batch, commands)
+    
     def _receive_response(self, sock: socket.socket) -> bytes:
         """Receive complete JSON response from socket"""
         chunks = []
@@ -79,7 +128,7 @@ class CadworkConnection:
             # Try to parse complete JSON
             try:
                 data = b''.join(chunks)
-                json.loads(data.decode('utf-8'))
+                _loads(data)
                 return data
             except json.JSONDecodeError:
                 continue
@@ -1,6 +1,7 @@
 """
 MCP Server setup and configuration
 """
+import asyncio
 import os
 from contextlib import asynccontextmanager
 from typing import AsyncIterator, Dict, Any
@@ -20,8 +21,8 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
     port = int(os.environ.get("CW_PORT", 53002))
     connection = initialize_connection(host, port)
     
-    # Test connection
-    handshake_ok = connection.test_connection()
+    # Test connection off the event loop, the ping blocks up to the socket timeout
+    handshake_ok = await asyncio.to_thread(connection.test_connection)
     if handshake_ok:
         log_info("Connection to Cadwork established successfully")
     else:
@@ -64,14 +64,32 @@ async def create_beam(p1: List[float], p2: List[float], width: float, height: fl
     
     # Add axis validation if helper is available
     if AXIS_CONFIG_AVAILABLE:
-        helper = CadworkAxisHelper()
         if p1[0] == p2[0] and p1[1] == p2[1]:  # Vertical beam detected
-            is_correct = helper.validate_beam_orientation(p1, p2, 'Z')
+            is_correct = CadworkAxisHelper.validate_beam_orientation(p1, p2, 'Z')
             if not is_correct:
                 result["axis_warning"] = "WARNING: Vertical beam may have incorrect axis orientation. Use Z-direction for longitudinal axis."
     
     return result
 
+@mcp.tool(
+    name="create_beams",
+    description="Creates several rectangular beams in a single request. Takes a list of beam definitions, each a dictionary with p1 ([x,y,z]), p2 ([x,y,z]), width, height and optional p3 ([x,y,z]). Much faster than calling create_beam repeatedly. Returns the IDs of the created beams. The same axis rules as for create_beam apply; beams that fail the vertical-axis check are listed by index in axis_warning."
+)
+async def create_beams(beams: List[Dict[str, Any]]) -> Dict[str, Any]:
+    result = await element_ctrl.create_beams(beams)
+    
+    # Same axis validation as create_beam, reported per beam index
+    if AXIS_CONFIG_AVAILABLE:
+        suspicious = [
+            index for index, beam in enumerate(beams)
+            if beam["p1"][0] == beam["p2"][0] and beam["p1"][1] == beam["p2"][1]
+            and not CadworkAxisHelper.validate_beam_orientation(beam["p1"], beam["p2"], 'Z')
+        ]
+        if suspicious:
+            result["axis_warning"] = f"WARNING: Vertical beams at indices {suspicious} may have incorrect axis orientation. Use Z-direction for longitudinal axis."
+    
+    return result
+
 @mcp.tool(
     name="create_panel", 
     description="Creates a rectangular panel element. Requires start point p1 ([x,y,z]), end point p2 ([x,y,z]), width, and thickness. IMPORTANT: When p1 and p2 define only a line (same x,y coordinates for vertical panels, or along a single axis), you MUST provide orientation point p3 ([x,y,z]) to define the panel's width direction and orientation, otherwise the panel will appear as a line. P3 defines the direction in which the panel's width extends from the p1-p2 line."
@@ -414,6 +432,13 @@ async def get_element_length(element_id: int) -> Dict[str, Any]:
 async def get_element_volume(element_id: int) -> Dict[str, Any]:
     return await geometry_ctrl.get_element_volume(element_id)
 
+@mcp.tool(
+    name="get_element_volumes",
+    description="Retrieves the volumes of several Cadwork elements in cubic millimeters with a single request. Returns a volumes list in the same order as element_ids (null for elements whose volume could not be read)."
+)
+async def get_element_volumes(element_ids: List[int]) -> Dict[str, Any]:
+    return await geometry_ctrl.get_element_volumes(element_ids)
+
 @mcp.tool(
     name="get_element_weight",
     description="Retrieves the weight of a specific Cadwork element in kilograms."
@@ -421,6 +446,13 @@ async def get_element_volume(element_id: int) -> Dict[str, Any]:
 async def get_element_weight(element_id: int) -> Dict[str, Any]:
     return await geometry_ctrl.get_element_weight(element_id)
 
+@mcp.tool(
+    name="get_element_dimensions",
+    description="Retrieves width, height, length (mm), volume (mm³) and weight (kg) of a specific Cadwork element in a single request. Faster than calling the individual getters one after another. Returns the numeric values under dimensions; any dimension that could not be read is listed in failed and the status is error."
+)
+async def get_element_dimensions(element_id: int) -> Dict[str, Any]:
+    return await geometry_ctrl.get_element_dimensions(element_id)
+
 # --- GEOMETRY VECTORS & POINTS ---
 
 @mcp.tool(
@@ -500,6 +532,13 @@ async def get_element_vertices(element_id: int) -> Dict[str, Any]:
 async def get_bounding_box(element_id: int) -> Dict[str, Any]:
     return await geometry_ctrl.get_bounding_box(element_id)
 
+@mcp.tool(
+    name="get_bounding_boxes",
+    description="Retrieves the bounding boxes of several Cadwork elements with a single request. Returns a bounding_boxes list in the same order as element_ids, each as [min_x, min_y, min_z, max_x, max_y, max_z] in mm (null for failed elements)."
+)
+async def get_bounding_boxes(element_ids: List[int]) -> Dict[str, Any]:
+    return await geometry_ctrl.get_bounding_boxes(element_ids)
+
 @mcp.tool(
     name="get_element_outline",
     description="Retrieves the 2D outline/contour of a Cadwork element projected to a plane. Returns outline coordinates for drawing purposes."
@@ -719,6 +758,20 @@ async def set_visibility(element_ids: List[int], visible: bool) -> Dict[str, Any
 async def set_transparency(element_ids: List[int], transparency: int) -> Dict[str, Any]:
     return await visualization_ctrl.set_transparency(element_ids, transparency)
 
+@mcp.tool(
+    name="set_colors",
+    description="Sets an individual color for each of many elements in one request. Takes element IDs and a color_ids list of the same length (1-255). Elements sharing a color are updated together."
+)
+async def set_colors(element_ids: List[int], color_ids: List[int]) -> Dict[str, Any]:
+    return await visualization_ctrl.set_colors(element_ids, color_ids)
+
+@mcp.tool(
+    name="set_transparencies",
+    description="Sets an individual transparency for each of many elements in one request. Takes element IDs and a transparencies list of the same length (0-100). Elements sharing a value are updated together."
+)
+async def set_transparencies(element_ids: List[int], transparencies: List[int]) -> Dict[str, Any]:
+    return await visualization_ctrl.set_transparencies(element_ids, transparencies)
+
 # --- VISUALIZATION GETTERS ---
 
 @mcp.tool(
@@ -847,6 +900,13 @@ async def set_comment(element_ids: List[int], comment: str) -> Dict[str, Any]:
 async def set_subgroup(element_ids: List[int], subgroup: str) -> Dict[str, Any]:
     return await attribute_ctrl.set_subgroup(element_ids, subgroup)
 
+@mcp.tool(
+    name="set_attributes",
+    description="Sets several standard attributes for a list of elements in one request. Takes element IDs and a dictionary with any of the keys name, material, group, comment, subgroup mapped to string values."
+)
+async def set_attributes(element_ids: List[int], attributes: Dict[str, str]) -> Dict[str, Any]:
+    return await attribute_ctrl.set_attributes(element_ids, attributes)
+
 @mcp.tool(
     name="set_user_attribute",
     description="Sets a user-defined attribute for a list of elements. Takes element IDs, attribute number (1-999), and attribute value string."
@@ -962,7 +1022,7 @@ async def get_cadwork_version_info() -> Dict[str, Any]:
     from core.connection import get_connection
     try:
         connection = get_connection()
-        return connection.send_command("get_version_info")
+        return await connection.send_command_async("get_version_info")
     except Exception as e:
         return {"status": "error", "message": f"Failed to get version info: {e}"}
 
@@ -1441,6 +1501,31 @@ async def optimize_cutting_list(element_ids: Optional[List[int]] = None,
                                                        material_groups, priority_mode)
 
 
+# Add a helper tool for axis information
+@mcp.tool(
+    name="get_cadwork_axis_info",
+    description="Returns important Cadwork axis direction information for correct beam and panel creation."
+)
+async def get_cadwork_axis_info() -> Dict[str, Any]:
+    if AXIS_CONFIG_AVAILABLE:
+        return {
+            "status": "ok",
+            "axis_info": CADWORK_AXIS_INFO,
+            "helper_available": True,
+            "standard_dimensions": CadworkAxisHelper.get_beam_dimensions("80x80"),
+            "validation_example": {
+                "vertical_beam_correct": CadworkAxisHelper.validate_beam_orientation([0,0,0], [0,0,800], 'Z'),
+                "horizontal_beam_x_correct": CadworkAxisHelper.validate_beam_orientation([0,0,0], [800,0,0], 'X')
+            }
+        }
+    else:
+        return {
+            "status": "warning", 
+            "message": "Cadwork axis configuration not loaded",
+            "basic_info": "For vertical beams: p1/p2 in Z-direction, width=X-axis, height=Y-axis"
+        }
+
+
 if __name__ == "__main__":
     import argparse
     logger = get_logger()
@@ -1479,28 +1564,3 @@ if __name__ == "__main__":
             logger.error(f"Server failed: {e}")
             import sys
             sys.exit(1)
-
-# Add a helper tool for axis information
-@mcp.tool(
-    name="get_cadwork_axis_info",
-    description="Returns important Cadwork axis direction information for correct beam and panel creation."
-)
-async def get_cadwork_axis_info() -> Dict[str, Any]:
-    if AXIS_CONFIG_AVAILABLE:
-        helper = CadworkAxisHelper()
-        return {
-            "status": "ok",
-            "axis_info": CADWORK_AXIS_INFO,
-            "helper_available": True,
-            "standard_dimensions": helper.get_beam_dimensions("80x80"),
-            "validation_example": {
-                "vertical_beam_correct": helper.validate_beam_orientation([0,0,0], [0,0,800], 'Z'),
-                "horizontal_beam_x_correct": helper.validate_beam_orientation([0,0,0], [800,0,0], 'X')
-            }
-        }
-    else:
-        return {
-            "status": "warning", 
-            "message": "Cadwork axis configuration not loaded",
-            "basic_info": "For vertical beams: p1/p2 in Z-direction, width=X-axis, height=Y-axis"
-        }